@@ -1,11 +1,19 @@
 # agents package
-from .base_agent import BaseAgent
-from .entry_agent import EntryAgent
-from .risk_agent import RiskAgent
-from .portfolio_agent import PortfolioAgent
-from .investment_agent import InvestmentAgent
-from .trading_agent import TradingAgent
-from .reviewer_agent import ReviewerAgent
+#
+# Agent classes are imported on first access (PEP 562) so that importing one
+# agent module, e.g. agents.risk_agent, does not also load every other agent
+# together with its prompt module and utilities (yfinance, cvxpy, ...).
+import importlib
+
+_LAZY = {
+    "BaseAgent": ".base_agent",
+    "EntryAgent": ".entry_agent",
+    "RiskAgent": ".risk_agent",
+    "PortfolioAgent": ".portfolio_agent",
+    "InvestmentAgent": ".investment_agent",
+    "TradingAgent": ".trading_agent",
+    "ReviewerAgent": ".reviewer_agent",
+}
 
 __all__ = [
     "BaseAgent",
@@ -17,3 +25,14 @@ __all__ = [
     "ReviewerAgent",
 ]
 
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,11 +5,15 @@ Provides common functionality for status management, logging, retry, and monitor
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, TypeVar, Type
-from langchain_openai import ChatOpenAI
-from state import AgentState
+from typing import Dict, Any, Optional, TypeVar, Type, Callable, Union, Mapping, TYPE_CHECKING
+from state import AgentState, DEFAULT_STATUS
+import asyncio
 import logging
+import threading
 import uuid
+from functools import lru_cache
+
+from langgraph.config import get_stream_writer
 
 from operation.logging.logging_config import get_logger, set_correlation_id, get_correlation_id
 from operation.retry.retry import retry_with_backoff
@@ -17,6 +21,9 @@ from operation.retry.retry_config import OPENAI_RETRY_CONFIG
 from operation.monitoring.metrics import get_metrics_registry
 from operation.monitoring.performance import track_performance, performance_timer
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 # Type variable for intent models
 IntentModel = TypeVar('IntentModel')
 
@@ -47,6 +54,8 @@ class BaseAgent(ABC):
         self.agent_name = agent_name
         self._logger = get_logger(f"agents.{agent_name}")
         self._metrics = get_metrics_registry()
+        # Serializes astep: agents keep conversation state on the instance
+        self._step_lock = threading.Lock()
         
         # Initialize correlation ID if not set
         if get_correlation_id() is None:
@@ -54,7 +63,7 @@ class BaseAgent(ABC):
     
     # ==================== Status Management ====================
     
-    def _get_status(self, state: AgentState, agent: str = None) -> Dict[str, bool]:
+    def _get_status(self, state: AgentState, agent: str = None) -> Mapping[str, bool]:
         """
         Get status tracking for a specific agent.
         
@@ -63,10 +72,12 @@ class BaseAgent(ABC):
             agent: Agent name (defaults to self.agent_name)
             
         Returns:
-            Status dictionary with 'done' and 'awaiting_input' keys
+            Read-only status mapping with 'done' and 'awaiting_input' keys;
+            use _set_status to change it
         """
         agent = agent or self.agent_name
-        return state.get("status_tracking", {}).get(agent, {"done": False, "awaiting_input": False})
+        tracking = state.get("status_tracking")
+        return tracking.get(agent, DEFAULT_STATUS) if tracking else DEFAULT_STATUS
     
     def _set_status(
         self, 
@@ -86,15 +97,14 @@ class BaseAgent(ABC):
         """
         agent = agent or self.agent_name
         
-        if "status_tracking" not in state:
-            state["status_tracking"] = {}
-        if agent not in state["status_tracking"]:
-            state["status_tracking"][agent] = {"done": False, "awaiting_input": False}
-        
+        # One lookup into the nested dict, reused for both updates
+        status = state.setdefault("status_tracking", {}).setdefault(
+            agent, dict(DEFAULT_STATUS)
+        )
         if done is not None:
-            state["status_tracking"][agent]["done"] = done
+            status["done"] = done
         if awaiting_input is not None:
-            state["status_tracking"][agent]["awaiting_input"] = awaiting_input
+            status["awaiting_input"] = awaiting_input
     
     # ==================== Message Helpers ====================
     
@@ -111,6 +121,25 @@ class BaseAgent(ABC):
             state["messages"] = []
         state["messages"].append({"role": role, "content": content})
     
+    def _emit_progress(self, content: str) -> None:
+        """
+        Send a progress note on LangGraph's custom stream.
+        
+        Unlike _add_message, the note is delivered while step is still running
+        to callers using stream/astream with stream_mode="custom", and it is not
+        kept in the conversation history. With invoke(), or when step is called
+        outside a graph, the note is dropped.
+        
+        Args:
+            content: Progress message content
+        """
+        try:
+            writer = get_stream_writer()
+        except RuntimeError:
+            # Not running inside a graph node
+            return
+        writer({"agent": self.agent_name, "progress": content})
+    
     def _get_last_user_message(self, state: AgentState) -> Optional[str]:
         """
         Get the last user message from state.
@@ -265,40 +294,58 @@ class BaseAgent(ABC):
     def _classify_intent_with_retry(
         self,
         user_input: str,
-        prompt_template: str,
+        prompt_template: Union[str, Callable[[str], Any]],
         intent_model: Type[IntentModel],
         structured_llm,
         default_intent: Optional[IntentModel] = None,
-        operation_name: str = "classify_intent"
+        operation_name: str = "classify_intent",
+        fast_path: Optional[Callable[[str], Optional[IntentModel]]] = None
     ) -> IntentModel:
         """
         Classify user intent using LLM with structured output, retry, and logging.
         
         Args:
             user_input: User's input text
-            prompt_template: Prompt template string (with {user_input} placeholder)
+            prompt_template: Prompt template string (with {user_input} placeholder),
+                or a function mapping user input to the prompt (string or chat messages)
             intent_model: Pydantic model class for structured output
             structured_llm: Pre-configured structured LLM
             default_intent: Default intent to return on error (optional)
             operation_name: Name of operation for logging
+            fast_path: Optional rule-based classifier; if it returns an intent
+                the LLM call is skipped
             
         Returns:
             Intent model instance
         """
-        prompt = prompt_template.format(user_input=user_input)
+        if fast_path is not None:
+            intent = fast_path(user_input)
+            if intent is not None:
+                self.logger.info(f"Intent classified by fast path: {getattr(intent, 'action', 'unknown')}")
+                self._metrics.counter(f"llm_calls_skipped_{self.agent_name}").inc()
+                return intent
+        
+        if callable(prompt_template):
+            prompt = prompt_template(user_input)
+        else:
+            prompt = prompt_template.format(user_input=user_input)
         
         self.logger.debug(f"Classifying intent for user input: {user_input[:50]}...")
         
         try:
             intent = self._invoke_llm_with_retry(structured_llm, prompt, operation_name)
             
-            # Normalize return
-            if isinstance(intent, dict):
-                intent = intent_model(**intent)
+            # Normalize return (structured output usually already yields intent_model)
+            if isinstance(intent, intent_model):
+                pass
+            elif isinstance(intent, (str, bytes)):
+                intent = intent_model.model_validate_json(intent)
+            elif isinstance(intent, dict):
+                intent = intent_model.model_validate(intent)
             elif hasattr(intent, "model_dump"):
-                intent = intent_model(**intent.model_dump())
+                intent = intent_model.model_validate(intent.model_dump())
             elif hasattr(intent, "dict"):
-                intent = intent_model(**intent.dict())
+                intent = intent_model.model_validate(intent.dict())
             
             action = getattr(intent, "action", "unknown")
             self.logger.info(f"Intent classified: {action}")
@@ -347,6 +394,69 @@ class BaseAgent(ABC):
             except Exception:
                 raise RuntimeError(f"Failed to create default intent for {intent_model.__name__}") from e
     
+    def _cache_classifier(
+        self,
+        classify: Callable[..., IntentModel],
+        failure_intent: IntentModel,
+        maxsize: int = 2048
+    ) -> Callable[..., IntentModel]:
+        """
+        Memoize a classifier whose result depends only on the user text and
+        any hashable context arguments passed after it.
+        
+        Only use this when everything the prompt depends on is in the arguments.
+        Inputs are keyed after stripping whitespace. When the classifier returns
+        failure_intent (the default_intent it passes on errors, compared by
+        identity) the cache is cleared, because lru_cache cannot drop a single
+        key and a failure must not be remembered as an answer.
+        
+        Args:
+            classify: Function mapping user input (and context) to an intent
+            failure_intent: Sentinel intent the classifier returns on errors
+            maxsize: Maximum number of cached inputs
+            
+        Returns:
+            Cached classifier with the same signature
+        """
+        cached = lru_cache(maxsize=maxsize)(classify)
+        
+        def lookup(user_input: str, *context) -> IntentModel:
+            intent = cached(user_input.strip(), *context)
+            if intent is failure_intent:
+                cached.cache_clear()
+            return intent
+        
+        lookup.cache_info = cached.cache_info
+        lookup.cache_clear = cached.cache_clear
+        return lookup
+    
+    # ==================== Async Execution ====================
+    
+    async def astep(self, state: AgentState) -> AgentState:
+        """
+        Async variant of step for graphs driven with ainvoke/astream.
+        
+        Intent classification and tool calls block on network or solver I/O,
+        so the step runs in a worker thread and the event loop stays free.
+        
+        Agents keep per-conversation state on the instance (questionnaire
+        progress, parameters, edit modes), so a compiled graph serves a single
+        session; build one graph per session to serve several. Overlapping
+        calls on the same agent are serialized by a per-agent lock so they
+        never interleave inside step.
+        
+        Args:
+            state: Current agent state
+            
+        Returns:
+            Updated agent state
+        """
+        def run_locked() -> AgentState:
+            with self._step_lock:
+                return self.step(state)
+        
+        return await asyncio.to_thread(run_locked)
+    
     # ==================== Performance Monitoring ====================
     
     def _track_step_performance(self, func):
@@ -5,20 +5,56 @@ This agent handles initial user interaction and routes to appropriate phases
 based on user intent and reviewer agent's next_phase field.
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
+import string
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from state import AgentState
-from prompts.entry_prompts import INTENT_CLASSIFICATION_PROMPT, EntryMessages, EntryIntent
+from prompts.entry_prompts import build_intent_prompt, EntryMessages, EntryIntent, UNCLEAR_INTENT_MESSAGE
 from .base_agent import BaseAgent
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+
+# One-word replies that always mean "go to the next phase"
+_PROCEED_WORDS = frozenset({
+    "yes", "y", "yep", "sure", "ok", "okay", "proceed", "continue", "next",
+    "go", "start", "begin", "ready", "done", "finished", "complete"
+})
+
+_STRIP_PUNCTUATION = str.maketrans("", "", string.punctuation)
+
+# Returned when classification fails; compared by identity so failures are never cached
+_UNKNOWN_INTENT = EntryIntent(action="unknown")
+
+
+def match_intent_keywords(user_input: str) -> Optional[EntryIntent]:
+    """
+    Classify one-word proceed replies without the LLM.
+    
+    Args:
+        user_input: User's input text
+        
+    Returns:
+        proceed EntryIntent if the input is a proceed word, None otherwise
+    """
+    if user_input.translate(_STRIP_PUNCTUATION).strip().lower() in _PROCEED_WORDS:
+        return EntryIntent(action="proceed")
+    return None
+
 
 class EntryAgent(BaseAgent):
     """Entry agent that handles user interaction and routing."""
     
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: "ChatOpenAI"):
         """Initialize the entry agent."""
         super().__init__(llm, agent_name="entry")
-        self._structured_llm = llm.with_structured_output(EntryIntent).bind(temperature=0.0)
+        # Strict JSON schema constrains decoding so the reply always parses into EntryIntent
+        self._structured_llm = llm.with_structured_output(
+            EntryIntent, method="json_schema", strict=True
+        ).bind(temperature=0.0)
+        # Entry classification depends only on the user text (fixed system prompt,
+        # no session context), so repeated inputs are answered from this cache
+        self._classify_intent = self._cache_classifier(self._classify_uncached, _UNKNOWN_INTENT)
     
     def step(self, state: AgentState) -> AgentState:
         """
@@ -65,20 +101,21 @@ class EntryAgent(BaseAgent):
             return self._handle_learn_more_intent(state, question)
         elif intent.action == "unknown":
             # Unknown intent - repeat last question with clarification
-            return self._handle_unknown_intent(state, fallback_message=EntryMessages.unclear_intent())
+            return self._handle_unknown_intent(state, fallback_message=UNCLEAR_INTENT_MESSAGE)
         else:
             # Fallback for any other action
-            return self._handle_unknown_intent(state, fallback_message=EntryMessages.unclear_intent())
+            return self._handle_unknown_intent(state, fallback_message=UNCLEAR_INTENT_MESSAGE)
     
-    def _classify_intent(self, user_input: str) -> EntryIntent:
+    def _classify_uncached(self, user_input: str) -> EntryIntent:
         """Classify user intent using LLM with structured output."""
         return self._classify_intent_with_retry(
             user_input,
-            INTENT_CLASSIFICATION_PROMPT,
+            build_intent_prompt,
             EntryIntent,
             self._structured_llm,
-            default_intent=EntryIntent(action="unknown"),  # Use unknown as default for error cases
-            operation_name="entry_classify_intent"
+            default_intent=_UNKNOWN_INTENT,  # Use unknown as default for error cases
+            operation_name="entry_classify_intent",
+            fast_path=match_intent_keywords
         )
     
     def _handle_proceed_intent(self, state: AgentState, next_phase: str) -> AgentState:
@@ -1,19 +1,31 @@
 # agents/investment_agent.py
 from __future__ import annotations
-from typing import Dict, Any, List, Optional, Literal
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional, Literal, TYPE_CHECKING
+import re
 from state import AgentState
 from utils.investment.investment_utils import InvestmentUtils
-from pydantic import BaseModel, Field
+from utils.investment.config import get_asset_class_from_alias
+from pydantic import BaseModel, ConfigDict, Field
 from prompts.investment_prompts import (
-    INTENT_CLASSIFICATION_PROMPT,
-    InvestmentMessages
+    build_intent_prompt,
+    NEED_PORTFOLIO_DATA_MESSAGE,
+    INTRO_MESSAGE,
+    EDIT_ASSET_CLASS_PROMPT,
+    NEED_INVESTMENT_FIRST_MESSAGE,
+    FUND_ANALYSIS_PROMPT,
+    UNCLEAR_INTENT_MESSAGE
 )
 from .base_agent import BaseAgent
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 # Intent Classification Model
 class InvestmentIntent(BaseModel):
     """Intent classification for investment agent user input."""
+    # Immutable and closed to unknown keys, matching EntryIntent
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     action: Literal[
         "create_investment",      # Start fund selection process
         "select_criteria",        # Choose selection criteria (balanced, low cost, etc.)
@@ -22,7 +34,7 @@ class InvestmentIntent(BaseModel):
         "analyze_fund",           # Analyze specific fund ticker
         "proceed",                # Move to next phase
         "unknown"                 # Unclear intent
-    ] = "unknown"
+    ]
     
     criteria: Optional[str] = Field(
         default=None,
@@ -40,6 +52,33 @@ class InvestmentIntent(BaseModel):
     )
 
 
+# "analyze VUG" style requests; anchored so longer sentences still go to the LLM.
+# The ticker must be typed in capitals so "analyze this" is not read as a ticker,
+# and is 3-5 letters like the prompt's definition so "tell me about US" is not.
+_ANALYZE_PATTERN = re.compile(
+    r"^\s*(?i:analy[sz]e|analysis(?:\s+of)?|tell\s+me\s+about)\s+(?P<ticker>[A-Z]{3,5})\s*[.!?]?\s*$"
+)
+
+
+def match_intent_keywords(user_input: str) -> Optional[InvestmentIntent]:
+    """
+    Classify bare asset class names and fund analysis requests without the LLM.
+    
+    Args:
+        user_input: User's input text
+        
+    Returns:
+        edit_asset_class or analyze_fund InvestmentIntent on a match, None otherwise
+    """
+    asset_class = get_asset_class_from_alias(user_input.rstrip(".!"))
+    if asset_class is not None:
+        return InvestmentIntent(action="edit_asset_class", asset_class=asset_class)
+    m = _ANALYZE_PATTERN.match(user_input)
+    if m:
+        return InvestmentIntent(action="analyze_fund", ticker=m.group("ticker"))
+    return None
+
+
 class InvestmentAgent(BaseAgent):
     """
     Investment agent that handles the conversion of asset-class portfolios
@@ -56,8 +95,11 @@ class InvestmentAgent(BaseAgent):
         super().__init__(llm, agent_name="investment")
         self.utils = InvestmentUtils(llm)
         
-        # Structured LLM for intent classification
-        self._structured_llm = llm.with_structured_output(InvestmentIntent).bind(temperature=0.0)
+        # Structured LLM for intent classification; strict JSON schema constrains
+        # decoding so the reply always parses into InvestmentIntent
+        self._structured_llm = llm.with_structured_output(
+            InvestmentIntent, method="json_schema", strict=True
+        ).bind(temperature=0.0)
         
         # Local state for mode tracking
         self._investment_criteria_selection = False
@@ -69,11 +111,12 @@ class InvestmentAgent(BaseAgent):
         """Classify user intent using LLM with structured output."""
         return self._classify_intent_with_retry(
             user_input,
-            INTENT_CLASSIFICATION_PROMPT,
+            build_intent_prompt,
             InvestmentIntent,
             self._structured_llm,
             default_intent=InvestmentIntent(action="unknown"),
-            operation_name="investment_classify_intent"
+            operation_name="investment_classify_intent",
+            fast_path=match_intent_keywords
         )
     
     def step(self, state: Dict[str, Any]) -> Dict[str, Any]:
@@ -94,7 +137,7 @@ class InvestmentAgent(BaseAgent):
         # Check if portfolio exists
         portfolio = state.get("portfolio", {})
         if not portfolio:
-            self._add_message(state, "ai", InvestmentMessages.need_portfolio_data())
+            self._add_message(state, "ai", NEED_PORTFOLIO_DATA_MESSAGE)
             return state
         
         # Only act on USER turns
@@ -142,7 +185,7 @@ class InvestmentAgent(BaseAgent):
             if investment and isinstance(investment, dict) and investment:
                 self.utils.display_investment_portfolio(state, investment)
             else:
-                self._add_message(state, "ai", InvestmentMessages.intro_message())
+                self._add_message(state, "ai", INTRO_MESSAGE)
             return state
         
         elif intent.action == "edit_asset_class":
@@ -155,16 +198,16 @@ class InvestmentAgent(BaseAgent):
                         self._investment_edit_asset_class = edit_data["asset_class"]
                         self._investment_edit_options = edit_data["options"]
                 else:
-                    self._add_message(state, "ai", InvestmentMessages.edit_asset_class_prompt())
+                    self._add_message(state, "ai", EDIT_ASSET_CLASS_PROMPT)
             else:
-                self._add_message(state, "ai", InvestmentMessages.need_investment_first())
+                self._add_message(state, "ai", NEED_INVESTMENT_FIRST_MESSAGE)
             return state
         
         elif intent.action == "analyze_fund":
             if intent.ticker:
                 return self.utils.handle_fund_analysis_request(state, intent.ticker)
             else:
-                self._add_message(state, "ai", InvestmentMessages.fund_analysis_prompt())
+                self._add_message(state, "ai", FUND_ANALYSIS_PROMPT)
                 return state
         
         elif intent.action == "proceed":
@@ -173,12 +216,14 @@ class InvestmentAgent(BaseAgent):
 
                 return state
             else:
-                self._add_message(state, "ai", InvestmentMessages.need_investment_first())
-                return state
+                # INTRO_MESSAGE and NEED_INVESTMENT_FIRST_MESSAGE both ask whether to
+                # "proceed with fund selection", so "proceed" here is a yes to that
+                self._investment_criteria_selection = True
+                return self.utils.create_initial_investment(state)
         
         elif intent.action == "unknown":
             # Unknown intent - repeat last question with clarification
-            fallback = InvestmentMessages.unclear_intent()
+            fallback = UNCLEAR_INTENT_MESSAGE
             return self._handle_unknown_intent(state, fallback_message=fallback)
         else:
             # Fallback for any other action - check if we're in criteria selection mode
@@ -208,7 +253,7 @@ class InvestmentAgent(BaseAgent):
                 self.utils.display_investment_portfolio(state, investment)
             
             # Show help message
-            self._add_message(state, "ai", InvestmentMessages.unclear_intent())
+            self._add_message(state, "ai", UNCLEAR_INTENT_MESSAGE)
             return state
     
     def router(self, state: Dict[str, Any]) -> str:
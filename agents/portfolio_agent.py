@@ -1,18 +1,32 @@
 # agents/portfolio_agent.py
 from __future__ import annotations
-from typing import Dict, Any, Optional, Literal
+from typing import Dict, Any, Optional, Literal, TYPE_CHECKING
 import os
+import re
 from utils.portfolio.config import get_expected_returns, get_covariance_matrix, DEFAULT_LAMBDA, DEFAULT_CASH_RESERVE, get_cash_reserve_constraints, validate_cash_reserve
 from utils.portfolio.portfolio_manager import PortfolioManager
 from state import AgentState
-from langchain_openai import ChatOpenAI
-from pydantic import BaseModel, Field
-from prompts.portfolio_prompts import INTENT_CLASSIFICATION_PROMPT, PortfolioMessages
+from pydantic import BaseModel, ConfigDict, Field
+from prompts.portfolio_prompts import (
+    build_intent_prompt,
+    INTENT_EXAMPLES,
+    NEED_RISK_DATA_MESSAGE,
+    LAMBDA_SET_MISSING_VALUE_MESSAGE,
+    OPTIMIZATION_IN_PROGRESS_MESSAGE,
+    OPTIMIZATION_FAILED_MESSAGE,
+    PortfolioMessages
+)
 from .base_agent import BaseAgent
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 
 class PortfolioIntent(BaseModel):
     """Intent classification for portfolio agent user input."""
+    # Immutable so the shared fallback and example instances can be reused
+    model_config = ConfigDict(frozen=True)
+    
     action: Literal["set_lambda", "set_cash", "run_optimization", "review", "proceed", "unknown"] = Field(
         description="The action the user wants to perform"
     )
@@ -26,6 +40,60 @@ class PortfolioIntent(BaseModel):
     )
 
 
+# Shared fallback returned when classification fails
+_UNKNOWN_INTENT = PortfolioIntent(action="unknown")
+
+# Single compound pattern for canonical commands. Anchored to the whole input
+# so anything conversational ("don't run yet") still goes to the LLM.
+_INTENT_PATTERN = re.compile(
+    r"^\s*(?:"
+    r"(?P<run>run|optimize|go)"
+    r"|(?P<proceed>proceed|next|continue)"
+    r"|(?P<review>review|show|display)"
+    r"|(?:set\s+)?lambda\s*(?:to|=|:|as)?\s*(?P<lam>\d+(?:\.\d+)?)"
+    r"|(?:set\s+)?cash(?:\s+reserve)?\s*(?:to|=|:|as)?\s*(?P<cash>\d*\.\d+|\d+)\s*(?P<percent>%)?"
+    r")\s*[.!]?\s*$",
+    re.IGNORECASE,
+)
+
+
+# The prompt's few-shot examples, keyed by normalized text, answer exact repeats
+_EXAMPLE_INTENTS = {
+    text.lower(): PortfolioIntent(action=action, **values)
+    for text, action, values in INTENT_EXAMPLES
+}
+
+
+def match_intent_keywords(user_input: str) -> Optional[PortfolioIntent]:
+    """
+    Classify canonical portfolio commands with a single regex scan, then
+    fall back to an exact match against the prompt's few-shot examples.
+    
+    Args:
+        user_input: User's input text
+        
+    Returns:
+        PortfolioIntent if the input is a canonical command, None otherwise
+    """
+    m = _INTENT_PATTERN.match(user_input)
+    if not m:
+        return _EXAMPLE_INTENTS.get(user_input.strip().rstrip(".!").lower())
+    if m.group("run"):
+        return PortfolioIntent(action="run_optimization")
+    if m.group("proceed"):
+        return PortfolioIntent(action="proceed")
+    if m.group("review"):
+        return PortfolioIntent(action="review")
+    if m.group("lam"):
+        return PortfolioIntent(action="set_lambda", lambda_value=float(m.group("lam")))
+    # "5%", whole numbers ("5", "1") and values above 1 ("2.5") are
+    # percentages; "0.05" is already a fraction
+    cash = float(m.group("cash"))
+    if m.group("percent") or "." not in m.group("cash") or cash > 1:
+        cash /= 100
+    return PortfolioIntent(action="set_cash", cash_value=cash)
+
+
 class PortfolioAgent(BaseAgent):
     """
     Portfolio management agent that handles portfolio optimization
@@ -51,11 +119,12 @@ class PortfolioAgent(BaseAgent):
         """Classify user intent using LLM with structured output."""
         return self._classify_intent_with_retry(
             user_input,
-            INTENT_CLASSIFICATION_PROMPT,
+            build_intent_prompt,
             PortfolioIntent,
             self._structured_llm,
-            default_intent=PortfolioIntent(action="unknown"),
-            operation_name="portfolio_classify_intent"
+            default_intent=_UNKNOWN_INTENT,
+            operation_name="portfolio_classify_intent",
+            fast_path=match_intent_keywords
         )
     
     def _format_portfolio(self, portfolio: Dict[str, float]) -> str:
@@ -87,18 +156,13 @@ class PortfolioAgent(BaseAgent):
         if not status["done"]:
             self._set_status(state, done=False)
         
+        # Risk gate - MUST precede any LLM call: without a risk allocation no
+        # intent can be acted on, so never spend a classification on it
         risk = state.get("risk") or {}
         if not risk:
-            self._add_message(state, "ai", PortfolioMessages.need_risk_data())
+            self._add_message(state, "ai", NEED_RISK_DATA_MESSAGE)
             return state
 
-        # Use instance variables for current parameters
-        lam = self._lambda
-        cash_reserve = self._cash_reserve
-        
-        # Get dynamic constraints from config
-        min_cash, max_cash = get_cash_reserve_constraints()
-        
         # Only act on USER turns
         if not self._is_user_turn(state):
             return state
@@ -106,8 +170,15 @@ class PortfolioAgent(BaseAgent):
         last_user = self._get_last_user_message(state)
         if not last_user:
             return state
-        
-        # Classify user intent
+
+        # Use instance variables for current parameters
+        lam = self._lambda
+        cash_reserve = self._cash_reserve
+
+        # Get dynamic constraints from config
+        min_cash, max_cash = get_cash_reserve_constraints()
+
+        # Classify user intent (only after all cheap checks above have passed)
         intent = self._classify_intent(last_user)
         
         # Handle different intents
@@ -116,7 +187,7 @@ class PortfolioAgent(BaseAgent):
                 self._lambda = intent.lambda_value
                 self._add_message(state, "ai", PortfolioMessages.lambda_set_success(intent.lambda_value, cash_reserve))
             else:
-                self._add_message(state, "ai", PortfolioMessages.lambda_set_missing_value())
+                self._add_message(state, "ai", LAMBDA_SET_MISSING_VALUE_MESSAGE)
             self._set_status(state, awaiting_input=True)
             return state
             
@@ -144,6 +215,9 @@ class PortfolioAgent(BaseAgent):
                 "lam": lam,
                 "cash_reserve": clamped_cash,
             }
+            # Streamed rather than added to messages: a message would only be seen
+            # together with the result, and would linger in the history
+            self._emit_progress(OPTIMIZATION_IN_PROGRESS_MESSAGE)
             res = self.portfolio_manager.execute_tool_call({"tool":"mean_variance_optimizer","args":call_args})
             if isinstance(res, dict) and res:
                 state["portfolio"] = res
@@ -154,7 +228,7 @@ class PortfolioAgent(BaseAgent):
                 # Set awaiting_input to True to allow review/editing, but not done yet
                 self._set_status(state, awaiting_input=True, done=False)
             else:
-                self._add_message(state, "ai", PortfolioMessages.optimization_failed())
+                self._add_message(state, "ai", OPTIMIZATION_FAILED_MESSAGE)
                 self._set_status(state, awaiting_input=True)
             return state
             
@@ -2,18 +2,52 @@
 Reviewer Agent - Validates completion and manages flow between phases
 """
 
-from typing import Dict, Any
-from langchain_openai import ChatOpenAI
+import re
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from state import AgentState
 from pydantic import BaseModel
 from prompts.reviewer_prompts import (
+    ReviewerAction,
     ReviewerIntent,
-    INTENT_CLASSIFICATION_PROMPT,
-    ReviewerMessages
+    build_intent_prompt,
+    FINAL_SUMMARY_WITH_OPTIONS_MESSAGE,
+    THANK_YOU_MESSAGE,
+    START_OVER_MESSAGE
 )
 from utils.reviewer.reviewer_utils import ReviewerUtils
 from .base_agent import BaseAgent
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+
+# (pattern, action) table for canonical replies, compiled once and tried in order.
+# Anchored to the whole input so anything conversational still goes to the LLM.
+_INTENT_PATTERNS = (
+    (re.compile(r"^\s*(?:start\s+over|start\s+again|restart|reset|new(?:\s+portfolio)?)\s*[.!]?\s*$", re.IGNORECASE), ReviewerAction.START_OVER),
+    (re.compile(r"^\s*(?:finish|finished|done|complete|end|exit|quit|bye|thanks?(?:\s+you)?)\s*[.!]?\s*$", re.IGNORECASE), ReviewerAction.FINISH),
+)
+
+
+# Returned when classification fails; compared by identity so failures are never cached
+_UNKNOWN_INTENT = ReviewerIntent(action=ReviewerAction.UNKNOWN)
+
+
+def match_intent_keywords(user_input: str) -> Optional[ReviewerIntent]:
+    """
+    Classify canonical start over / finish replies without the LLM.
+    
+    Args:
+        user_input: User's input text
+        
+    Returns:
+        ReviewerIntent if the input matches a canonical reply, None otherwise
+    """
+    for pattern, action in _INTENT_PATTERNS:
+        if pattern.match(user_input):
+            return ReviewerIntent(action=action)
+    return None
+
 
 class ReviewerAgent(BaseAgent):
     """
@@ -21,20 +55,24 @@ class ReviewerAgent(BaseAgent):
     Simplified version: validates phase completion, shows final summary when all complete.
     """
     
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: "ChatOpenAI"):
         super().__init__(llm, agent_name="reviewer")
         self.utils = ReviewerUtils()
         self._structured_llm = llm.with_structured_output(ReviewerIntent).bind(temperature=0.0)
+        # The reviewer prompt is fixed and carries no session context, so
+        # repeated inputs are answered from a per-agent cache
+        self._classify_intent = self._cache_classifier(self._classify_uncached, _UNKNOWN_INTENT)
     
-    def _classify_intent(self, user_input: str) -> ReviewerIntent:
+    def _classify_uncached(self, user_input: str) -> ReviewerIntent:
         """Classify user intent using LLM with structured output."""
         return self._classify_intent_with_retry(
             user_input,
-            INTENT_CLASSIFICATION_PROMPT,
+            build_intent_prompt,
             ReviewerIntent,
             self._structured_llm,
-            default_intent=ReviewerIntent(action="unknown"),
-            operation_name="reviewer_classify_intent"
+            default_intent=_UNKNOWN_INTENT,
+            operation_name="reviewer_classify_intent",
+            fast_path=match_intent_keywords
         )
     
     def step(self, state: AgentState) -> AgentState:
@@ -44,18 +82,16 @@ class ReviewerAgent(BaseAgent):
         1. If all phases complete: show summary and handle user input
         2. Otherwise: validate output and update state
         """
-        # Validate all phases
-        phases = ["risk", "portfolio", "investment", "trading"]
-        validation_results = {}
-        
-        for phase in phases:
-            is_complete, feedback = self.utils.validate_phase_completion(state, phase)
-            validation_results[phase] = (is_complete, feedback)
-        
-        # Check if all phases are complete
-        all_complete = all(is_complete for is_complete, _ in validation_results.values())
+        # Validate phases only until the flag is set; once all are complete the
+        # reviewer just handles user input. A single scan finds the first
+        # incomplete phase, which is also where the flow proceeds next.
+        all_complete = state.get("all_phases_complete", False)
+        next_phase = None
+        if not all_complete:
+            next_phase = self.utils.get_next_phase(state)
+            all_complete = next_phase is None
         
-        if all_complete or state.get("all_phases_complete", False):
+        if all_complete:
             # All phases complete - show final summary and handle user input
             if not state.get("all_phases_complete"):
                 # First time showing summary
@@ -63,7 +99,7 @@ class ReviewerAgent(BaseAgent):
                 
                 # Generate and show summary with options
                 completion_message = self.utils.generate_final_completion_message(state)
-                self._add_message(state, "ai", f"{completion_message}\n\n{ReviewerMessages.final_summary_with_options()}")
+                self._add_message(state, "ai", f"{completion_message}\n\n{FINAL_SUMMARY_WITH_OPTIONS_MESSAGE}")
                 self._set_status(state, awaiting_input=True)
                 return state
             
@@ -73,19 +109,19 @@ class ReviewerAgent(BaseAgent):
                 if last_user:
                     intent = self._classify_intent(last_user)
                     
-                    if intent.action == "start_over":
+                    if intent.action is ReviewerAction.START_OVER:
                         self.utils.reset_state(state)
                         state["messages"] = []  # Clear all messages first
-                        self._add_message(state, "ai", ReviewerMessages.start_over_message())
+                        self._add_message(state, "ai", START_OVER_MESSAGE)
                         self._set_status(state, done=False, awaiting_input=True)
                         return state
                     
-                    elif intent.action == "finish":
-                        self._add_message(state, "ai", ReviewerMessages.thank_you_message())
+                    elif intent.action is ReviewerAction.FINISH:
+                        self._add_message(state, "ai", THANK_YOU_MESSAGE)
                         self._set_status(state, awaiting_input=True)
                         return state
                     
-                    elif intent.action == "unknown":
+                    elif intent.action is ReviewerAction.UNKNOWN:
                         # Unknown intent - repeat last question with clarification
                         return self._handle_unknown_intent(state)
                     
@@ -95,16 +131,13 @@ class ReviewerAgent(BaseAgent):
             
         else:
             # Not all complete - just validate and update state
-            # Check if user said "proceed" (coming from entry agent)
-            next_phase = self.utils.get_next_phase(state)
+            # Update state to proceed to the first incomplete phase
+            ready_to_proceed = state.get("ready_to_proceed")
+            if ready_to_proceed is None:
+                ready_to_proceed = state["ready_to_proceed"] = {}
+            ready_to_proceed[next_phase] = True
+            state["next_phase"] = next_phase
             
-            if next_phase:
-                # Update state to proceed to next phase
-                if "ready_to_proceed" not in state or state["ready_to_proceed"] is None:
-                    state["ready_to_proceed"] = {}
-                state["ready_to_proceed"][next_phase] = True
-                state["next_phase"] = next_phase
-        
             self._set_status(state, awaiting_input=False)
 
         # Clear all intent flags
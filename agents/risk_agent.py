@@ -1,23 +1,35 @@
 # agents/risk_agent.py
 from __future__ import annotations
-from typing import TypedDict, List, Dict, Any, Optional, Literal
+from typing import TypedDict, List, Dict, Any, Optional, Literal, Tuple, TYPE_CHECKING
 import re
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 
 from utils.risk.risk_manager import RiskManager, MCQuestion, MCAnswer
 from state import AgentState
 from prompts.risk_prompts import (
     RISK_INTENT_SYSTEM_PROMPT,
+    MODE_SELECTION_MESSAGE,
+    QUESTIONNAIRE_QUESTION_TEMPLATE,
+    UNKNOWN_INTENT_MESSAGE,
+    PROCEED_WITHOUT_RISK_MESSAGE,
+    INVALID_EQUITY_MESSAGE,
+    NO_RISK_ALLOCATION_MESSAGE,
     RiskMessages
 )
 from .base_agent import BaseAgent
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 
 class RiskIntent(BaseModel):
     """Structured output for risk agent intent classification."""
+    # Immutable so cached instances can be shared
+    model_config = ConfigDict(frozen=True)
+    
     action: Literal[
         "set_equity",           # User wants to set equity directly
         "use_guidance",         # User wants to use questionnaire
@@ -30,6 +42,88 @@ class RiskIntent(BaseModel):
     reply: str = ""
 
 
+# Returned when classification fails; compared by identity so failures are never cached
+_UNKNOWN_INTENT = RiskIntent(action="unknown")
+
+# Direct equity settings: "60%", "0.6", ".6", "set as 0.6", "set equity to 70%".
+# Bare integers are excluded because "1"/"2" answer the mode selection question.
+_EQUITY_PATTERN = re.compile(
+    r"(?:set\s+(?:as|equity\s*(?:to|as|=)?)\s*|equity\s*(?:=|:)?\s*)?"
+    r"(?:(?P<pct>\d+(?:\.\d+)?)\s*%|(?P<dec>0?\.\d+|1\.0+))\s*[.!]?",
+    re.IGNORECASE,
+)
+
+# One-word commands and the action they always mean
+_KEYWORD_ACTIONS = {
+    "proceed": "proceed",
+    "continue": "proceed",
+    "next": "proceed",
+    "done": "proceed",
+    "review": "review_edit",
+    "edit": "review_edit",
+    "change": "review_edit",
+    "guidance": "use_guidance",
+    "use guidance": "use_guidance",
+    "questionnaire": "use_guidance",
+    "use the questionnaire": "use_guidance",
+    "help me decide": "use_guidance",
+    "start": "start_journey",
+    "begin": "start_journey",
+}
+
+
+def match_intent_keywords(user_input: str) -> Optional[RiskIntent]:
+    """
+    Classify direct equity settings and one-word commands without the LLM.
+    
+    Args:
+        user_input: User's input text
+        
+    Returns:
+        RiskIntent if the input is a canonical command, None otherwise
+    """
+    text = user_input.strip()
+    m = _EQUITY_PATTERN.fullmatch(text)
+    if m:
+        equity = float(m.group("pct")) / 100 if m.group("pct") else float(m.group("dec"))
+        if equity > 1.0:
+            return None
+        return RiskIntent(action="set_equity", equity_value=equity)
+    action = _KEYWORD_ACTIONS.get(text.rstrip(".!").lower())
+    if action is None:
+        return None
+    return RiskIntent(action=action)
+
+
+# Patterns used by RiskAgent._parse_choice, compiled once at import
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_NUMBER_PATTERN = re.compile(r"\b(\d{1,2})\b")
+
+_ORDINALS = {
+    "first": 1, "1st": 1, "second": 2, "2nd": 2, "third": 3, "3rd": 3,
+    "fourth": 4, "4th": 4, "fifth": 5, "5th": 5, "sixth": 6, "6th": 6,
+    "seventh": 7, "7th": 7, "eighth": 8, "8th": 8, "ninth": 9, "9th": 9,
+    "tenth": 10, "10th": 10,
+}
+_ORDINAL_PATTERN = re.compile(r"\b(" + "|".join(map(re.escape, _ORDINALS)) + r")\b")
+
+
+@lru_cache(maxsize=None)
+def _render_options(q: MCQuestion) -> str:
+    """Numbered option lines for a question, rendered once per question."""
+    return "\n".join(f"{i}) {opt}" for i, opt in enumerate(q.options, start=1))
+
+
+@lru_cache(maxsize=None)
+def _option_tokens(q: MCQuestion) -> Tuple[Tuple[Tuple[str, ...], int], ...]:
+    """Significant tokens of each option with the hit count needed to match it."""
+    result = []
+    for opt in q.options:
+        toks = tuple(t for t in opt.lower().split() if len(t) > 2)
+        result.append((toks, max(1, len(toks) // 2)))
+    return tuple(result)
+
+
 class RiskAgent(BaseAgent):
     """
     Risk assessment agent that handles both direct equity input and questionnaire-based risk profiling.
@@ -53,61 +147,57 @@ class RiskAgent(BaseAgent):
         
         # Structured LLM for intent classification
         self._structured_llm = llm.with_structured_output(RiskIntent).bind(temperature=0.0)
+        # The prompt depends only on the user text and the context flags passed
+        # alongside it, so repeated (input, context) pairs skip the LLM
+        self._classify_intent = self._cache_classifier(self._classify_uncached, _UNKNOWN_INTENT)
     
-    def _classify_risk_intent(self, state: AgentState) -> RiskIntent:
-        """Classify user intent using structured LLM output."""
-        if not state.get("messages"):
-            return RiskIntent(action="unknown", equity_value=None, reply="")
-        
-        last_user_msg = self._get_last_user_message(state)
+    def _classify_risk_intent(self, state: AgentState, last_user_msg: Optional[str]) -> RiskIntent:
+        """Classify the last user message using structured LLM output."""
         if not last_user_msg:
-            return RiskIntent(action="unknown", equity_value=None, reply="")
-        
-        # Context information
-        has_risk = bool(state.get("risk"))
-        in_questionnaire = self._in_questionnaire
-        current_question_idx = self._current_question_idx
-        
-        system = RISK_INTENT_SYSTEM_PROMPT
-
-        user_prompt = f"""Context:
+            return _UNKNOWN_INTENT
+        
+        return self._classify_intent(
+            last_user_msg,
+            bool(state.get("risk")),
+            self._in_questionnaire,
+            self._current_question_idx
+        )
+    
+    def _classify_uncached(
+        self,
+        user_input: str,
+        has_risk: bool,
+        in_questionnaire: bool,
+        current_question_idx: int
+    ) -> RiskIntent:
+        """Classify user intent in the given context, trying the fast path first."""
+        def build_prompt(user_input: str) -> list:
+            user_prompt = f"""Context:
 - Has risk allocation: {has_risk}
 - In questionnaire: {in_questionnaire}
 - Current question index: {current_question_idx}
 
-User message: "{last_user_msg}"
+User message: "{user_input}"
 
 Classify the intent and extract equity value if applicable."""
-
-        try:
-            prompt = [
-                {"role": "system", "content": system},
+            return [
+                {"role": "system", "content": RISK_INTENT_SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt}
             ]
-            
-            intent = self._invoke_llm_with_retry(
-                self._structured_llm,
-                prompt,
-                operation_name="risk_classify_intent"
-            )
-            
-            # Normalize return
-            if isinstance(intent, dict):
-                return RiskIntent(**intent)
-            elif hasattr(intent, "model_dump"):
-                return RiskIntent(**intent.model_dump())
-            elif hasattr(intent, "dict"):
-                return RiskIntent(**intent.dict())
-            else:
-                return RiskIntent(action="unknown", equity_value=None, reply="")
-                
-        except Exception as e:
-            self.logger.error(f"Error classifying risk intent: {e}", exc_info=True)
-            return RiskIntent(action="unknown", equity_value=None, reply="")
+        
+        return self._classify_intent_with_retry(
+            user_input,
+            build_prompt,
+            RiskIntent,
+            self._structured_llm,
+            default_intent=_UNKNOWN_INTENT,
+            operation_name="risk_classify_intent",
+            fast_path=match_intent_keywords
+        )
     
     def _ask_mode_selection(self, state: AgentState) -> AgentState:
         """Ask user to choose between direct equity or guidance."""
-        self._add_message(state, "ai", RiskMessages.mode_selection())
+        self._add_message(state, "ai", MODE_SELECTION_MESSAGE)
         self._set_status(state, awaiting_input=True)
         return state
     
@@ -115,7 +205,7 @@ Classify the intent and extract equity value if applicable."""
         """Handle direct equity input."""
         # Validate equity range
         if not (0.05 <= equity_value <= 0.95):
-            msg = RiskMessages.invalid_equity()
+            msg = INVALID_EQUITY_MESSAGE
             self._add_message(state, "ai", msg)
             self._set_status(state, awaiting_input=True)
             return state
@@ -132,7 +222,7 @@ Classify the intent and extract equity value if applicable."""
     def _handle_review_edit(self, state: AgentState) -> AgentState:
         """Handle review/edit commands."""
         if not state.get("risk"):
-            msg = RiskMessages.no_risk_allocation()
+            msg = NO_RISK_ALLOCATION_MESSAGE
             self._add_message(state, "ai", msg)
             self._set_status(state, awaiting_input=True)
             return state
@@ -149,8 +239,7 @@ Classify the intent and extract equity value if applicable."""
         self._in_questionnaire = True
         self._current_question_idx = 0
         state["answers"] = {}
-        self._set_status(state, done=False)
-        self._set_status(state, awaiting_input=True)
+        self._set_status(state, done=False, awaiting_input=True)
         
         # Clear existing risk allocation to start fresh
         state["risk"] = None
@@ -167,27 +256,18 @@ Classify the intent and extract equity value if applicable."""
         q = self.risk_manager.questions[self._current_question_idx]
         
         # Render question with numbered options
-        lines = [q.text, ""]
-        for i, opt in enumerate(q.options, start=1):
-            lines.append(f"{i}) {opt}")
-        lines += ["", RiskMessages.questionnaire_question_template()]
-        
-        msg = "\n".join(lines)
+        msg = f"{q.text}\n\n{_render_options(q)}\n\n{QUESTIONNAIRE_QUESTION_TEMPLATE}"
         self._add_message(state, "ai", msg)
         self._set_status(state, awaiting_input=True)
         return state
     
-    def _handle_questionnaire_response(self, state: AgentState) -> AgentState:
+    def _handle_questionnaire_response(self, state: AgentState, last_user: Optional[str]) -> AgentState:
         """Handle user response to questionnaire question."""
-        if not self._is_user_turn(state):
-            return state
-        
         # Check bounds
         if self._current_question_idx >= len(self.risk_manager.questions):
             # All questions answered - finalize
             return self._finalize_questionnaire(state)
         
-        last_user = self._get_last_user_message(state)
         if not last_user:
             return state
         
@@ -195,10 +275,7 @@ Classify the intent and extract equity value if applicable."""
         
         # Handle "why" requests
         if any(word in last_user.lower() for word in ["why", "explain", "not sure", "help"]):
-            msg = f"{q.guidance}\n\n{q.text}\n\n"
-            for i, opt in enumerate(q.options, start=1):
-                msg += f"{i}) {opt}\n"
-            msg += "\nReply with the option number (e.g., '2')."
+            msg = f"{q.guidance}\n\n{q.text}\n\n{_render_options(q)}\n\nReply with the option number (e.g., '2')."
             self._add_message(state, "ai", msg)
             self._set_status(state, awaiting_input=True)
             return state
@@ -207,8 +284,7 @@ Classify the intent and extract equity value if applicable."""
         choice_result = self._parse_choice(last_user, q)
         if choice_result is None:
             # Unclear input -> retry
-            options_text = "\n".join([f"{i}) {opt}" for i, opt in enumerate(q.options, start=1)])
-            msg = RiskMessages.unknown_questionnaire_response(q.text, options_text) + "\n\nReply with the option number (e.g., '2')."
+            msg = RiskMessages.unknown_questionnaire_response(q.text, _render_options(q)) + "\n\nReply with the option number (e.g., '2')."
             self._add_message(state, "ai", msg)
             self._set_status(state, awaiting_input=True)
             return state
@@ -219,12 +295,11 @@ Classify the intent and extract equity value if applicable."""
         qid = q.id
         if "answers" not in state:
             state["answers"] = {}
+        # Question text and options live in risk_manager.questions; only the
+        # choice is kept in state so checkpoints stay small
         state["answers"][qid] = {
-            "question_id": qid,
             "selected_index": choice_idx,
             "selected_label": choice_text,
-            "question_text": q.text,
-            "options": q.options,
         }
         
         # Move to next question
@@ -235,35 +310,29 @@ Classify the intent and extract equity value if applicable."""
     
     def _parse_choice(self, user_text: str, q: MCQuestion) -> Optional[tuple[int, str]]:
         """Parse user input to extract selected option."""
-        text = re.sub(r"\s+", " ", user_text.lower().strip())
+        text = _WHITESPACE_PATTERN.sub(" ", user_text.lower().strip())
         
         # Check for numeric input
-        m = re.search(r"\b(\d{1,2})\b", text)
+        m = _NUMBER_PATTERN.search(text)
         if m:
             k = int(m.group(1))
             if 1 <= k <= len(q.options):
                 return k - 1, q.options[k - 1]
         
-        # Check for ordinal words
-        ordinals = {
-            "first": 1, "1st": 1, "second": 2, "2nd": 2, "third": 3, "3rd": 3,
-            "fourth": 4, "4th": 4, "fifth": 5, "5th": 5, "sixth": 6, "6th": 6,
-            "seventh": 7, "7th": 7, "eighth": 8, "8th": 8, "ninth": 9, "9th": 9,
-            "tenth": 10, "10th": 10,
-        }
-        
-        for word, num in ordinals.items():
-            if re.search(rf"\b{re.escape(word)}\b", text) and 1 <= num <= len(q.options):
-                return num - 1, q.options[num - 1]
+        # Check for ordinal words; the lowest valid ordinal mentioned wins
+        nums = [
+            _ORDINALS[word] for word in _ORDINAL_PATTERN.findall(text)
+            if _ORDINALS[word] <= len(q.options)
+        ]
+        if nums:
+            num = min(nums)
+            return num - 1, q.options[num - 1]
         
         # Simple fuzzy token overlap
         matches = []
-        for i, opt in enumerate(q.options):
-            key = re.sub(r"\s+", " ", opt.lower().strip())
-            toks = [t for t in key.split() if len(t) > 2]
-            hits = sum(1 for t in toks if t in text)
-            if hits >= max(1, len(toks) // 2):
-                matches.append((i, opt))
+        for i, (toks, needed) in enumerate(_option_tokens(q)):
+            if sum(1 for t in toks if t in text) >= needed:
+                matches.append((i, q.options[i]))
         
         if len(matches) == 1:
             return matches[0]
@@ -282,10 +351,9 @@ Classify the intent and extract equity value if applicable."""
         eq_pct = round(eq * 100.0, 1)
         bd_pct = round(bd * 100.0, 1)
         
-        # Map qid -> label from questions
-        qlabel_by_id = {q.id: q.label for q in self.risk_manager.questions}
-        
-        msg = RiskMessages.questionnaire_finalization(eq_pct/100, bd_pct/100, state["answers"])
+        answers = state["answers"]
+        responses = [(q.text, answers[q.id]["selected_label"]) for q in self.risk_manager.questions]
+        msg = RiskMessages.questionnaire_finalization(eq_pct/100, bd_pct/100, responses)
         self._add_message(state, "ai", msg)
         
         # Reset questionnaire state
@@ -309,15 +377,19 @@ Classify the intent and extract equity value if applicable."""
         if not self._is_user_turn(state):
             return state
         
+        # Read the user's message once for this turn
+        last_user = self._get_last_user_message(state)
+        
+        # Handle questionnaire responses; these are parsed locally, so the
+        # intent classifier is not consulted
+        if self._in_questionnaire:
+            return self._handle_questionnaire_response(state, last_user)
+        
         # Classify user intent
-        intent = self._classify_risk_intent(state)
+        intent = self._classify_risk_intent(state, last_user)
         action = intent.action
         equity_value = intent.equity_value
         
-        # Handle questionnaire responses
-        if self._in_questionnaire:
-            return self._handle_questionnaire_response(state)
-        
         # Handle different actions
         if action == "set_equity" and equity_value is not None:
             return self._handle_direct_equity(state, equity_value)
@@ -336,7 +408,7 @@ Classify the intent and extract equity value if applicable."""
                 self._set_status(state, done=True, awaiting_input=False)
                 return state
             else:
-                msg = RiskMessages.proceed_without_risk()
+                msg = PROCEED_WITHOUT_RISK_MESSAGE
                 self._add_message(state, "ai", msg)
                 self._set_status(state, awaiting_input=True)
                 return state
@@ -349,7 +421,7 @@ Classify the intent and extract equity value if applicable."""
                 return self._ask_mode_selection(state)
             else:
                 # Repeat last question with clarification
-                fallback = RiskMessages.unknown_intent()
+                fallback = UNKNOWN_INTENT_MESSAGE
                 return self._handle_unknown_intent(state, fallback_message=fallback)
         else:
             # Fallback for any other action
@@ -357,7 +429,7 @@ Classify the intent and extract equity value if applicable."""
                 self._risk_intro_done = True
                 return self._ask_mode_selection(state)
             else:
-                fallback = RiskMessages.unknown_intent()
+                fallback = UNKNOWN_INTENT_MESSAGE
                 return self._handle_unknown_intent(state, fallback_message=fallback)
     
     def router(self, state: AgentState) -> str:
@@ -6,20 +6,120 @@ and the SoftObjectiveRebalancer for tax-aware rebalancing.
 """
 
 from __future__ import annotations
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
+import re
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from state import AgentState
 from utils.trading.trading_utils import TradingUtils
 from utils.trading.trading_scenarios import ALL_SCENARIOS, get_scenario_by_index
 from prompts.trading_prompts import (
     TradingIntent, 
     ScenarioSelectionIntent,
-    INTENT_CLASSIFICATION_PROMPT, 
-    SCENARIO_SELECTION_PROMPT,
+    build_intent_prompt,
+    build_scenario_prompt,
     TradingMessages
 )
 from .base_agent import BaseAgent
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+
+# Returned when classification fails; compared by identity so failures are never cached
+_UNKNOWN_INTENT = TradingIntent(action="unknown")
+_UNKNOWN_SCENARIO = ScenarioSelectionIntent(action="unknown")
+
+# Canonical one-phrase commands from the intent prompt's examples
+_KEYWORD_ACTIONS = {
+    "execute": "run_rebalancing",
+    "run": "run_rebalancing",
+    "run rebalancing": "run_rebalancing",
+    "rebalance": "run_rebalancing",
+    "generate trades": "run_rebalancing",
+    "create trades": "run_rebalancing",
+    "trade now": "run_rebalancing",
+    "review": "review",
+    "show": "review",
+    "display": "review",
+    "current settings": "review",
+    "proceed": "proceed",
+    "next": "proceed",
+    "continue": "proceed",
+    "looks good": "proceed",
+}
+
+# "integer shares only" -> True, "allow fractional shares" -> False
+_SHARES_KEYWORDS = {
+    "integer shares": True,
+    "integer shares only": True,
+    "whole shares only": True,
+    "fractional shares": False,
+    "allow fractional shares": False,
+}
+
+# Parameter settings, anchored to the whole input so anything conversational
+# ("what tax weight should I use?") still goes to the LLM
+_TAX_WEIGHT_PATTERN = re.compile(
+    r"^\s*(?:(?:set|override)\s+)?tax[_ ]?weight\s*(?:to|=|:|as)?\s*(?P<value>\d*\.?\d+)\s*$",
+    re.IGNORECASE,
+)
+_LTCG_PATTERN = re.compile(
+    r"^\s*(?:(?:set|override)\s+)?(?:ltcg|capital\s+gains?)(?:\s+rate)?\s*(?:to|=|:|as)?\s*"
+    r"(?P<value>\d*\.?\d+)\s*(?P<percent>%)?\s*$",
+    re.IGNORECASE,
+)
+_SCENARIO_PATTERN = re.compile(
+    r"\s*(?:(?:select|choose|use)\s+)?(?:scenario\s+)?(?P<number>[1-6])\s*",
+    re.IGNORECASE,
+)
+
+
+def match_intent_keywords(user_input: str) -> Optional[TradingIntent]:
+    """
+    Classify canonical trading commands and parameter settings without the LLM.
+    
+    Args:
+        user_input: User's input text
+        
+    Returns:
+        TradingIntent if the input is a canonical command, None otherwise
+    """
+    text = " ".join(user_input.lower().split()).rstrip(".!")
+    action = _KEYWORD_ACTIONS.get(text)
+    if action:
+        return TradingIntent(action=action)
+    if text in _SHARES_KEYWORDS:
+        return TradingIntent(action="set_integer_shares", integer_shares=_SHARES_KEYWORDS[text])
+    m = _TAX_WEIGHT_PATTERN.match(text)
+    if m:
+        return TradingIntent(action="set_tax_weight", tax_weight=float(m.group("value")))
+    m = _LTCG_PATTERN.match(text)
+    if m:
+        # "20%", whole numbers ("20", "1") and values above 1 ("20.5") are
+        # percentages; "0.2" is already a fraction
+        rate = float(m.group("value"))
+        if m.group("percent") or "." not in m.group("value") or rate > 1:
+            rate /= 100
+        return TradingIntent(action="set_ltcg_rate", ltcg_rate=rate)
+    return None
+
+
+def match_scenario_keywords(user_input: str) -> Optional[ScenarioSelectionIntent]:
+    """
+    Classify a bare scenario number ("3", "select 2") or "custom" without the LLM.
+    
+    Args:
+        user_input: User's input text
+        
+    Returns:
+        ScenarioSelectionIntent if the input is a canonical selection, None otherwise
+    """
+    m = _SCENARIO_PATTERN.fullmatch(user_input)
+    if m:
+        return ScenarioSelectionIntent(action="select_scenario", scenario_number=int(m.group("number")))
+    if user_input.strip().lower() == "custom":
+        return ScenarioSelectionIntent(action="custom_portfolio")
+    return None
+
 
 class TradingAgent(BaseAgent):
     """
@@ -35,6 +135,11 @@ class TradingAgent(BaseAgent):
         self._structured_llm = llm.with_structured_output(TradingIntent).bind(temperature=0.0)
         self._scenario_llm = llm.with_structured_output(ScenarioSelectionIntent).bind(temperature=0.0)
         
+        # Both prompts are fixed and carry no session context, so repeated inputs
+        # ("1", "execute", "review", ...) are answered from per-agent caches
+        self._classify_intent = self._cache_classifier(self._classify_intent_uncached, _UNKNOWN_INTENT)
+        self._classify_scenario_selection = self._cache_classifier(self._classify_scenario_uncached, _UNKNOWN_SCENARIO)
+        
         # Local parameters with defaults from config
         from utils.trading.config import DEFAULT_REBALANCE_CONFIG
         config = DEFAULT_REBALANCE_CONFIG
@@ -46,26 +151,28 @@ class TradingAgent(BaseAgent):
         self._selected_scenario = None
         self._awaiting_scenario_selection = False
     
-    def _classify_intent(self, user_input: str) -> TradingIntent:
+    def _classify_intent_uncached(self, user_input: str) -> TradingIntent:
         """Classify user intent using LLM with structured output."""
         return self._classify_intent_with_retry(
             user_input,
-            INTENT_CLASSIFICATION_PROMPT,
+            build_intent_prompt,
             TradingIntent,
             self._structured_llm,
-            default_intent=TradingIntent(action="unknown"),
-            operation_name="trading_classify_intent"
+            default_intent=_UNKNOWN_INTENT,
+            operation_name="trading_classify_intent",
+            fast_path=match_intent_keywords
         )
     
-    def _classify_scenario_selection(self, user_input: str) -> ScenarioSelectionIntent:
+    def _classify_scenario_uncached(self, user_input: str) -> ScenarioSelectionIntent:
         """Classify scenario selection intent using LLM with structured output."""
         return self._classify_intent_with_retry(
             user_input,
-            SCENARIO_SELECTION_PROMPT,
+            build_scenario_prompt,
             ScenarioSelectionIntent,
             self._scenario_llm,
-            default_intent=ScenarioSelectionIntent(action="unknown"),
-            operation_name="trading_classify_scenario"
+            default_intent=_UNKNOWN_SCENARIO,
+            operation_name="trading_classify_scenario",
+            fast_path=match_scenario_keywords
         )
     
     def _handle_scenario_selection(self, state: AgentState, user_input: str) -> AgentState:
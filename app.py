@@ -5,6 +5,7 @@ from dotenv import load_dotenv
 
 from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph, END
+from langchain_core.runnables import RunnableLambda
 
 from agents.entry_agent import EntryAgent
 from agents.risk_agent import RiskAgent
@@ -29,12 +30,18 @@ def build_graph(llm: ChatOpenAI):
     investment_agent = InvestmentAgent(llm)
     trading_agent = TradingAgent(llm)
 
-    builder.add_node("robo_entry", entry_agent.step)
-    builder.add_node("reviewer_agent", reviewer_agent.step)
-    builder.add_node("risk_agent", risk_agent.step)
-    builder.add_node("portfolio_agent", portfolio_agent.step)
-    builder.add_node("investment_agent", investment_agent.step)
-    builder.add_node("trading_agent", trading_agent.step)
+    # Sync step for invoke(); astep runs it in a worker thread for ainvoke()/astream()
+    # so blocking LLM and optimizer calls do not stall the event loop. Agents hold
+    # per-conversation state, so each compiled graph serves a single session.
+    def node(agent):
+        return RunnableLambda(agent.step, afunc=agent.astep)
+
+    builder.add_node("robo_entry", node(entry_agent))
+    builder.add_node("reviewer_agent", node(reviewer_agent))
+    builder.add_node("risk_agent", node(risk_agent))
+    builder.add_node("portfolio_agent", node(portfolio_agent))
+    builder.add_node("investment_agent", node(investment_agent))
+    builder.add_node("trading_agent", node(trading_agent))
 
     builder.set_entry_point("robo_entry")  # Start with entry agent
 
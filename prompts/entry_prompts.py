@@ -2,142 +2,170 @@
 Entry agent prompts and messages.
 """
 
-from pydantic import BaseModel
+from dataclasses import dataclass
+from types import MappingProxyType
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, Literal
 
+__all__ = [
+    "EntryIntent",
+    "ENTRY_INTENT_SYSTEM_PROMPT",
+    "build_intent_prompt",
+    "PhaseInfo",
+    "PHASES",
+    "WELCOME_MESSAGE",
+    "UNCLEAR_INTENT_MESSAGE",
+    "PHASE_COMPLETE_MESSAGE",
+    "EntryMessages",
+]
+
 # Intent Classification Model
 class EntryIntent(BaseModel):
     """Structured output for entry agent intent classification."""
+    # Immutable so cached instances can be shared; no stray keys from the LLM
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     action: Literal["proceed", "learn_more", "unknown"]  # User actions including unknown intent
     question: Optional[str] = None  # Structured question about what they want to learn
 
-# Intent Classification Prompt
-INTENT_CLASSIFICATION_PROMPT = """
-You are an investment planning assistant. Classify the user's intent and extract relevant information.
+# Intent classification system prompt. It contains no per-call data so the
+# whole prompt is a stable prefix; the user input is sent as the last message.
+ENTRY_INTENT_SYSTEM_PROMPT = """
+Classify the user's intent in an investment planning session.
 
-User input: "{user_input}"
-
-You must respond with a JSON object matching this exact structure:
-{{
-    "action": "proceed" or "learn_more",
-    "question": "string or null"
-}}
+Actions:
+- proceed: continue to the next phase (e.g., "yes", "proceed", "next", "ok"); question is null
+- learn_more: asks about a phase or the process (e.g., "what is risk assessment", "how does trading work"); set question to a clear, specific question such as "What is risk assessment and how does it work?"
+- unknown: anything else; question is null
+"""
 
-Available actions and their expected outputs:
 
-**proceed** - User wants to continue to the next phase
-- Examples: "yes", "proceed", "continue", "next", "go ahead", "start", "begin", "ok", "ready"
-- Output: {{"action": "proceed", "question": null}}
+def build_intent_prompt(user_input: str) -> list:
+    """Build the intent classification messages for the given user input."""
+    return [
+        {"role": "system", "content": ENTRY_INTENT_SYSTEM_PROMPT},
+        {"role": "user", "content": user_input}
+    ]
 
-**learn_more** - User wants to learn more about something
-- Examples: "what is risk assessment", "tell me about portfolio", "explain investment selection", "how does trading work", "what happens in risk phase", "why do I need portfolio optimization"
-- Output: {{"action": "learn_more", "question": "What is risk assessment and how does it work?"}}
-- Convert user's question into a clear, structured question about the investment process
 
-**Context Rules:**
-1. If user input indicates they want to continue or move forward, use proceed
-2. If user input asks questions about specific phases or wants explanations, use learn_more
-3. Use null for question when action is proceed
-4. Convert user's question into a clear, structured question when action is learn_more
-5. Make questions specific and actionable (e.g., "What is risk assessment?" not "tell me about risk")
+@dataclass(frozen=True, slots=True)
+class PhaseInfo:
+    """Everything the entry agent says about one phase."""
+    display_name: str      # Name shown to the user
+    short_action: str      # What the phase helps the user do
+    long_explanation: str  # Detailed explanation of what the phase involves
+    summary: str           # Stage summary shown when the phase starts
 
-Respond with ONLY the JSON object, no other text.
-"""
 
-# Entry Messages Class
-class EntryMessages:
-    """Entry agent system messages and responses."""
-    
-    @staticmethod
-    def welcome_message() -> str:
-        """Welcome message for new users."""
-        return "Welcome to the AI Robo-Advisor! I'll help you create a personalized investment plan through a structured process."
-    
-    @staticmethod
-    def next_phase_intro(phase: str) -> str:
-        """Introduction message for the next phase."""
-        phase_descriptions = {
-            "risk": "Risk Assessment",
-            "portfolio": "Portfolio Construction", 
-            "investment": "Fund Selection",
-            "trading": "Trading Implementation"
-        }
-        
-        phase_name = phase_descriptions.get(phase, phase.title())
-        
-        return f"Great! Let's move to **{phase_name}**. This phase will help you {'assess your risk tolerance and determine your asset allocation' if phase == 'risk' else 'build an optimized portfolio based on your risk profile' if phase == 'portfolio' else 'select specific funds and ETFs for your portfolio' if phase == 'investment' else 'generate trading requests to implement your investment plan'}."
-    
-    @staticmethod
-    def phase_explanation(phase: str) -> str:
-        """Detailed explanation of what a phase involves."""
-        explanations = {
-            "risk": """
+# Single source of truth for per-phase text, in phase order (read-only view)
+PHASES = MappingProxyType({
+    "risk": PhaseInfo(
+        display_name="Risk Assessment",
+        short_action="assess your risk tolerance and determine your asset allocation",
+        long_explanation="""
 **Risk Assessment Phase:**
 • Complete a questionnaire about your investment goals and risk tolerance
 • OR directly set your equity/bond allocation (e.g., 60% stocks, 40% bonds)
 • This determines how aggressive or conservative your portfolio should be
 • Based on your age, income, goals, and risk comfort level
-            """,
-            "portfolio": """
+""",
+        summary="**Start Risk Assessment** ✅\n\nYour risk profile will be determined based on your investment goals and risk tolerance."
+    ),
+    "portfolio": PhaseInfo(
+        display_name="Portfolio Construction",
+        short_action="build an optimized portfolio based on your risk profile",
+        long_explanation="""
 **Portfolio Construction Phase:**
 • Uses mean-variance optimization to create an optimal asset allocation
 • Considers your risk profile from the previous phase
 • Allocates across different asset classes (large cap, small cap, international, bonds, etc.)
 • Balances risk and return based on modern portfolio theory
-            """,
-            "investment": """
+""",
+        summary="**Start Portfolio Construction** ✅\n\nYour optimized portfolio allocation will be created using mean-variance optimization."
+    ),
+    "investment": PhaseInfo(
+        display_name="Fund Selection",
+        short_action="select specific funds and ETFs for your portfolio",
+        long_explanation="""
 **Fund Selection Phase:**
 • Converts your asset allocation into specific funds and ETFs
 • Choose selection criteria: Balanced, Low Cost, High Performance, or Low Risk
 • Selects the best funds for each asset class based on your criteria
 • Provides detailed fund analysis and comparison options
-            """,
-            "trading": """
+""",
+        summary="**Start Fund Analysis and Selection ** ✅\n\nYour investment portfolio will be constructed by selecting funds for each asset class."
+    ),
+    "trading": PhaseInfo(
+        display_name="Trading Implementation",
+        short_action="generate trading requests to implement your investment plan",
+        long_explanation="""
 **Trading Implementation Phase:**
 • Generates specific trading requests to implement your investment plan
 • Considers your account value, current holdings, and tax implications
 • Creates buy/sell orders with exact quantities and prices
 • Handles rebalancing and position adjustments
-            """
-        }
-        
-        return explanations.get(phase, f"Information about {phase} phase is not available.")
+""",
+        summary="**Start Trading Execution** ✅\n\nYour trading execution will be generated with specific buy/sell orders."
+    ),
+})
+
+# Options appended to every stage summary
+_STAGE_SUMMARY_OPTIONS = """
+
+**What would you like to do next?**
+• **Proceed** to the phase
+• **Learn more** about any phase by asking me questions
+"""
+
+
+# Static messages (builders that take parameters stay on the Messages class)
+
+# Welcome message for new users.
+WELCOME_MESSAGE = "Welcome to the AI Robo-Advisor! I'll help you create a personalized investment plan through a structured process."
+
+# Message when user intent is unclear.
+UNCLEAR_INTENT_MESSAGE = "I'm not sure what you'd like to do. You can say 'proceed' to continue to the next phase, or ask me about any specific phase (risk assessment, portfolio construction, fund selection, or trading implementation)."
+
+# Message when all phases are complete.
+PHASE_COMPLETE_MESSAGE = "Congratulations! You've completed all phases of the investment planning process. Your personalized investment plan is ready."
+
+
+# Entry Messages Class
+class EntryMessages:
+    """Entry agent system messages and responses."""
     
     @staticmethod
-    def proceed_confirmation(phase: str) -> str:
-        """Confirmation message when user wants to proceed."""
-        return f"Perfect! Let's proceed to the {phase} phase. Type 'yes' or 'proceed' to continue, or ask me about what this phase involves."
+    def next_phase_intro(phase: str) -> str:
+        """Introduction message for the next phase."""
+        info = PHASES.get(phase)
+        phase_name = info.display_name if info else phase.title()
+        action = (info or PHASES["trading"]).short_action
+        
+        return f"Great! Let's move to **{phase_name}**. This phase will help you {action}."
     
     @staticmethod
-    def unclear_intent() -> str:
-        """Message when user intent is unclear."""
-        return "I'm not sure what you'd like to do. You can say 'proceed' to continue to the next phase, or ask me about any specific phase (risk assessment, portfolio construction, fund selection, or trading implementation)."
+    def phase_explanation(phase: str) -> str:
+        """Detailed explanation of what a phase involves."""
+        info = PHASES.get(phase)
+        return info.long_explanation if info else f"Information about {phase} phase is not available."
     
     @staticmethod
-    def phase_complete_message() -> str:
-        """Message when all phases are complete."""
-        return "Congratulations! You've completed all phases of the investment planning process. Your personalized investment plan is ready."
+    def proceed_confirmation(phase: str) -> str:
+        """Confirmation message when user wants to proceed."""
+        return f"Perfect! Let's proceed to the {phase} phase. Type 'yes' or 'proceed' to continue, or ask me about what this phase involves."
     
     # Stage summaries dictionary
-    STAGE_SUMMARIES = {
-        
-        "risk": "**Start Risk Assessment** ✅\n\nYour risk profile will be determined based on your investment goals and risk tolerance.",
-        
-        "portfolio": "**Start Portfolio Construction** ✅\n\nYour optimized portfolio allocation will be created using mean-variance optimization.",
-        
-        "investment": "**Start Fund Analysis and Selection ** ✅\n\nYour investment portfolio will be constructed by selecting funds for each asset class.",
-        
-        "trading": "**Start Trading Execution** ✅\n\nYour trading execution will be generated with specific buy/sell orders."
-    }
+    STAGE_SUMMARIES = MappingProxyType({phase: info.summary for phase, info in PHASES.items()})
+    
+    # Full stage summaries with next-step options, built once at import
+    _STAGE_SUMMARIES_FULL = MappingProxyType({
+        stage: summary + _STAGE_SUMMARY_OPTIONS for stage, summary in STAGE_SUMMARIES.items()
+    })
     
     @staticmethod
     def get_stage_summary(stage: str) -> str:
         """Get summary for a completed stage."""
-        summary = EntryMessages.STAGE_SUMMARIES.get(stage, f"Stage {stage} completed.")
-        
-        return f"""{summary}
-
-**What would you like to do next?**
-• **Proceed** to the phase
-• **Learn more** about any phase by asking me questions
-"""
+        summary = EntryMessages._STAGE_SUMMARIES_FULL.get(stage)
+        if summary is None:
+            summary = f"Stage {stage} completed.{_STAGE_SUMMARY_OPTIONS}"
+        return summary
@@ -4,11 +4,31 @@ Portfolio Agent Prompts
 This module contains all the prompts and system messages used by the portfolio agent.
 """
 
-# Intent classification prompt
-INTENT_CLASSIFICATION_PROMPT = """
-You are a portfolio optimization assistant. Classify the user's intent from their input.
+from functools import lru_cache
+
+# Few-shot examples as (user input, action, extracted values). They are rendered
+# into the system prompt below and double as an exact-match lookup table so
+# the agent can answer these inputs without calling the LLM.
+INTENT_EXAMPLES = (
+    ("set cash as 0.02", "set_cash", {"cash_value": 0.02}),
+    ("lambda 1.5", "set_lambda", {"lambda_value": 1.5}),
+    ("run", "run_optimization", {}),
+    ("review", "review", {}),
+    ("proceed", "proceed", {}),
+    ("looks good", "proceed", {}),
+    ("I'm satisfied", "proceed", {}),
+    ("hello", "unknown", {}),
+)
+
+_EXAMPLES_TEXT = "\n".join(
+    f'- "{text}" -> action: {action}' + "".join(f", {k}: {v}" for k, v in values.items())
+    for text, action, values in INTENT_EXAMPLES
+)
 
-User input: "{user_input}"
+# Intent classification system prompt. It contains no per-call data so the
+# whole prompt is a stable, cacheable prefix; the user input is sent as the last message.
+PORTFOLIO_INTENT_SYSTEM_PROMPT = """
+You are a portfolio optimization assistant. Classify the user's intent from their input.
 
 Available actions:
 - set_lambda: User wants to set the lambda parameter (e.g., "set lambda to 1.5", "lambda 2")
@@ -22,36 +42,47 @@ Extract the specific values if setting parameters. For cash reserve, use values
 For lambda, use positive values typically between 0.1 and 10.
 
 Examples:
-- "set cash as 0.02" -> action: set_cash, cash_value: 0.02
-- "lambda 1.5" -> action: set_lambda, lambda_value: 1.5
-- "run" -> action: run_optimization
-- "review" -> action: review
-- "proceed" -> action: proceed
-- "looks good" -> action: proceed
-- "I'm satisfied" -> action: proceed
-- "hello" -> action: unknown
-"""
+""" + _EXAMPLES_TEXT + "\n"
+
+
+def build_intent_prompt(user_input: str) -> list:
+    """Build the intent classification messages for the given user input."""
+    return [
+        {"role": "system", "content": PORTFOLIO_INTENT_SYSTEM_PROMPT},
+        {"role": "user", "content": user_input}
+    ]
+
+
+# Static messages (builders that take parameters stay on the Messages class)
+
+# Message when risk data is not available.
+NEED_RISK_DATA_MESSAGE = "I need the equity/bond recommendation from the risk Agent before I can build the portfolio."
+
+# Message when lambda value is not specified.
+LAMBDA_SET_MISSING_VALUE_MESSAGE = "Please specify a lambda value. For example: 'set lambda to 1.5' or 'lambda 2'"
+
+# Message when optimization is starting.
+OPTIMIZATION_IN_PROGRESS_MESSAGE = "⏳ Optimizing your portfolio... This may take a moment."
+
+# Message when optimization fails.
+OPTIMIZATION_FAILED_MESSAGE = "❌ **Portfolio optimization failed.** Please try again or adjust your parameters."
+
+# Message when user wants to proceed.
+PROCEED_SUCCESS_MESSAGE = "✅ **Great!** Proceeding to the next step."
+
 
 # System messages
 class PortfolioMessages:
     """Portfolio agent system messages and responses."""
     
     @staticmethod
-    def need_risk_data() -> str:
-        """Message when risk data is not available."""
-        return "I need the equity/bond recommendation from the risk Agent before I can build the portfolio."
-    
-    @staticmethod
+    @lru_cache(maxsize=128)
     def lambda_set_success(lambda_value: float, cash_reserve: float) -> str:
         """Message when lambda is successfully set."""
         return f"✅ Set lambda to {lambda_value}. Current parameters: • Lambda: {lambda_value} • Cash Reserve: {cash_reserve:.2f}\n\nSay 'run' to optimize or 'set cash to X' to adjust further."
     
     @staticmethod
-    def lambda_set_missing_value() -> str:
-        """Message when lambda value is not specified."""
-        return "Please specify a lambda value. For example: 'set lambda to 1.5' or 'lambda 2'"
-    
-    @staticmethod
+    @lru_cache(maxsize=128)
     def cash_set_success(cash_value: float, lambda_value: float) -> str:
         """Message when cash reserve is successfully set."""
         return f"✅ Set cash reserve to {cash_value:.2f}. Current parameters: • Lambda: {lambda_value} • Cash Reserve: {cash_value:.2f}\n\nSay 'run' to optimize or 'set lambda to X' to adjust further."
@@ -71,11 +102,6 @@ class PortfolioMessages:
         """Message when optimization is successful."""
         return f"✅ **Optimization complete**{note}. I've built your asset-class portfolio.\n\n{portfolio_table}\n\n**What would you like to do next?**\n• **Review** weights: say 'review'\n• **Proceed** to ETF selection: say 'proceed'"
     
-    @staticmethod
-    def optimization_failed() -> str:
-        """Message when optimization fails."""
-        return "❌ **Portfolio optimization failed.** Please try again or adjust your parameters."
-    
     @staticmethod
     def review_current_portfolio(portfolio_table: str, lambda_value: float, cash_reserve: float) -> str:
         """Message for reviewing current portfolio."""
@@ -89,8 +115,3 @@ class PortfolioMessages:
             f"Defaults are **lambda = {lambda_value}** and **cash_reserve = {cash_reserve:.2f}**.\n"
             f"Say \"set lambda to 1\", \"set cash to {max_cash:.2f}\", or just \"run\" to optimize now."
         )
-    
-    @staticmethod
-    def proceed_success() -> str:
-        """Message when user wants to proceed."""
-        return "✅ **Great!** Proceeding to the next step."
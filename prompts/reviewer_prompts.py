@@ -1,22 +1,50 @@
 """
 Reviewer Agent Prompts
+
+The lookup tables in this module are read-only views (MappingProxyType) shared
+by every importer; they must never be mutated.
 """
 
-from pydantic import BaseModel, Field
-from typing import Literal
+from enum import Enum
+from types import MappingProxyType
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Final
+
+__all__ = [
+    "ReviewerAction",
+    "ReviewerIntent",
+    "REVIEWER_SYSTEM_PROMPT",
+    "REVIEWER_VALIDATION_PROMPTS",
+    "REVIEWER_PROCEED_PROMPTS",
+    "REVIEWER_COMPLETION_MESSAGE",
+    "REVIEWER_INTENT_SYSTEM_PROMPT",
+    "build_intent_prompt",
+    "FINAL_SUMMARY_WITH_OPTIONS_MESSAGE",
+    "FINAL_COMPLETION_MESSAGE_TEMPLATE",
+    "THANK_YOU_MESSAGE",
+    "START_OVER_MESSAGE",
+]
+
+
+# Enum members are singletons, so the agent dispatches with `is`; as a str
+# subclass the JSON schema sent to the LLM and string comparisons are unchanged.
+class ReviewerAction(str, Enum):
+    """Reviewer agent actions."""
+    VALIDATE = "validate"        # Normal validation flow (from proceed after completing a phase)
+    START_OVER = "start_over"    # User wants to start over
+    FINISH = "finish"            # User wants to finish
+    UNKNOWN = "unknown"          # Unclear intent
 
 
 class ReviewerIntent(BaseModel):
     """Intent classification for reviewer agent user input."""
-    action: Literal[
-        "validate",        # Normal validation flow (from proceed after completing a phase)
-        "start_over",      # User wants to start over
-        "finish",          # User wants to finish
-        "unknown"          # Unclear intent
-    ] = "unknown"
+    # Immutable so cached instances can be shared
+    model_config = ConfigDict(frozen=True)
+    
+    action: ReviewerAction = ReviewerAction.UNKNOWN
 
 
-REVIEWER_SYSTEM_PROMPT = """You are a Reviewer Agent responsible for validating completion of each phase and managing the overall flow.
+REVIEWER_SYSTEM_PROMPT: Final = """You are a Reviewer Agent responsible for validating completion of each phase and managing the overall flow.
 
 Your responsibilities:
 1. Validate that each phase (risk, portfolio, investment, trading) is complete
@@ -26,33 +54,33 @@ Your responsibilities:
 
 You should be helpful, clear, and guide users through the process."""
 
-REVIEWER_VALIDATION_PROMPTS = {
-    "risk": {
+REVIEWER_VALIDATION_PROMPTS: Final = MappingProxyType({
+    "risk": MappingProxyType({
         "complete": "Risk assessment is complete with equity/bond allocation.",
         "incomplete": "Risk assessment needs completion. Please complete the risk questionnaire."
-    },
-    "portfolio": {
+    }),
+    "portfolio": MappingProxyType({
         "complete": "Portfolio optimization is complete with asset class weights.",
         "incomplete": "Portfolio construction needs completion. Please run the optimization."
-    },
-    "investment": {
+    }),
+    "investment": MappingProxyType({
         "complete": "Investment selection is complete with specific fund choices.",
         "incomplete": "Investment selection needs completion. Please select funds for your portfolio."
-    },
-    "trading": {
+    }),
+    "trading": MappingProxyType({
         "complete": "Trading requests are complete and ready for execution.",
         "incomplete": "Trading requests need completion. Please generate trading orders."
-    }
-}
+    })
+})
 
-REVIEWER_PROCEED_PROMPTS = {
+REVIEWER_PROCEED_PROMPTS: Final = MappingProxyType({
     "risk": "Risk assessment is complete! Would you like to **proceed** to portfolio construction or **edit** your risk allocation?",
     "portfolio": "Portfolio optimization is complete! Would you like to **proceed** to investment selection or **edit** your portfolio weights?",
     "investment": "Investment selection is complete! Would you like to **proceed** to trading requests or **edit** your fund choices?",
     "trading": "Trading requests are complete! Your portfolio is ready for execution. Would you like to **review** your trading orders or **edit** them?"
-}
+})
 
-REVIEWER_COMPLETION_MESSAGE = """🎉 **All Phases Complete!**
+REVIEWER_COMPLETION_MESSAGE: Final = """🎉 **All Phases Complete!**
 
 Congratulations! You have successfully completed all phases of the robo-advisor process:
 
@@ -64,12 +92,11 @@ Congratulations! You have successfully completed all phases of the robo-advisor
 Your personalized investment plan is now ready! You can review any phase or proceed with execution."""
 
 
-# Intent classification prompt
-INTENT_CLASSIFICATION_PROMPT = """
+# Intent classification system prompt. It contains no per-call data so the
+# whole prompt is a stable, cacheable prefix; the user input is sent as the last message.
+REVIEWER_INTENT_SYSTEM_PROMPT: Final = """
 You are a reviewer assistant. Classify the user's intent from their input.
 
-User input: "{user_input}"
-
 Available actions:
 - validate: Normal validation flow (when user just completed a phase and reviewer needs to validate)
 - start_over: User wants to start fresh with a new portfolio (e.g., "start over", "new portfolio", "reset", "restart")
@@ -89,26 +116,49 @@ Examples:
 """
 
 
-class ReviewerMessages:
-    """Reviewer agent system messages and responses."""
-    
-    @staticmethod
-    def final_summary_with_options() -> str:
-        """Final summary message with next step options."""
-        return """🎉 **Portfolio Planning Complete!**
+def build_intent_prompt(user_input: str) -> list:
+    """Build the intent classification messages for the given user input."""
+    return [
+        {"role": "system", "content": REVIEWER_INTENT_SYSTEM_PROMPT},
+        {"role": "user", "content": user_input}
+    ]
+
+
+# Static messages (builders that take parameters stay on the Messages class)
+
+# Final summary message with next step options.
+FINAL_SUMMARY_WITH_OPTIONS_MESSAGE = """🎉 **Portfolio Planning Complete!**
 
 Your personalized investment plan is ready. All phases have been successfully completed.
 
 **What would you like to do next?**
 • **Start over** - Create a new portfolio from scratch
 • **Finish** - Complete the session and exit"""
-    
-    @staticmethod
-    def thank_you_message() -> str:
-        """Thank you message when user finishes."""
-        return "Thank you for using the Robo-Advisor! Your personalized investment plan has been created and is ready for execution."
-    
-    @staticmethod
-    def start_over_message() -> str:
-        """Message when starting over."""
-        return "Great! Let's start fresh with a new portfolio. How can I assist you today?"
+
+# Final completion message; format with portfolio_summary.
+FINAL_COMPLETION_MESSAGE_TEMPLATE = """🎉 **Portfolio Planning Complete!**
+
+Congratulations! You have successfully completed all phases of the robo-advisor process:
+
+✅ **Risk Assessment** - Your risk tolerance and asset allocation
+✅ **Portfolio Construction** - Optimized asset class weights  
+✅ **Investment Selection** - Specific funds and ETFs chosen
+✅ **Trading Requests** - Ready-to-execute trading orders
+
+---
+
+## 📊 **Your Complete Portfolio Summary**
+
+{portfolio_summary}
+
+---
+
+**What's Next?**
+
+Type **"proceed"** to confirm acknowledgement of the summary."""
+
+# Thank you message when user finishes.
+THANK_YOU_MESSAGE = "Thank you for using the Robo-Advisor! Your personalized investment plan has been created and is ready for execution."
+
+# Message when starting over.
+START_OVER_MESSAGE = "Great! Let's start fresh with a new portfolio. How can I assist you today?"
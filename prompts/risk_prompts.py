@@ -5,6 +5,8 @@ This file contains all the prompts, examples, and templates used by the risk age
 to keep the main agent code clean and maintainable.
 """
 
+from functools import lru_cache
+
 # Risk Intent Classification System Prompt
 RISK_INTENT_SYSTEM_PROMPT = """You are a risk assessment agent. Classify user intent for risk profile management.
 
@@ -35,21 +37,42 @@ EXAMPLES:
 - "hello" → action="unknown"
 """
 
-# Risk Messages Class
-class RiskMessages:
-    """Risk agent system messages and responses."""
-    
-    @staticmethod
-    def mode_selection() -> str:
-        """Message for mode selection (direct vs guidance)."""
-        return """Great! Let's define your risk profile. You have two options:
+# Static messages (builders that take parameters stay on the Messages class)
+
+# Message for mode selection (direct vs guidance).
+MODE_SELECTION_MESSAGE = """Great! Let's define your risk profile. You have two options:
 
 1) **Set your equity allocation directly** (e.g., 'set equity to 0.6' or '60%')
 2) **Use guidance** to help you determine the right allocation through a questionnaire
 
 Which would you prefer?"""
+
+# Template for questionnaire questions.
+QUESTIONNAIRE_QUESTION_TEMPLATE = """Reply with the option number (e.g., '2'), or say 'I pick the second one'. If unsure, say 'why?'."""
+
+# Message for unknown or unclear intent.
+UNKNOWN_INTENT_MESSAGE = """I'm not sure what you'd like to do. You can:
+• **Set your equity allocation** directly (e.g., 'set equity to 0.6')
+• **Use guidance** to determine your allocation through a questionnaire
+• **Review/edit** your current allocation if you have one set
+• **Proceed** to the next step if your risk profile is complete"""
+
+# Message when proceeding without risk allocation.
+PROCEED_WITHOUT_RISK_MESSAGE = MODE_SELECTION_MESSAGE
+
+# Message for invalid equity allocation.
+INVALID_EQUITY_MESSAGE = "Please provide an equity allocation between 0.05 and 0.95 (e.g., 0.70 for 70%)."
+
+# Message when no risk allocation is set.
+NO_RISK_ALLOCATION_MESSAGE = "No risk allocation set yet. Please set your equity allocation first."
+
+
+# Risk Messages Class
+class RiskMessages:
+    """Risk agent system messages and responses."""
     
     @staticmethod
+    @lru_cache(maxsize=128)
     def direct_equity_confirmation(equity: float) -> str:
         """Confirmation message for direct equity setting."""
         bond = 1.0 - equity
@@ -61,6 +84,7 @@ To continue, you can:
 • **Proceed** to portfolio construction by saying 'proceed'"""
     
     @staticmethod
+    @lru_cache(maxsize=128)
     def review_edit_message(equity: float) -> str:
         """Message for reviewing/editing current allocation."""
         bond = 1.0 - equity
@@ -72,53 +96,21 @@ You can:
 • **Proceed** to portfolio construction"""
     
     @staticmethod
-    def questionnaire_question_template() -> str:
-        """Template for questionnaire questions."""
-        return """Reply with the option number (e.g., '2'), or say 'I pick the second one'. If unsure, say 'why?'."""
-    
-    @staticmethod
-    def questionnaire_finalization(equity: float, bond: float, answers: dict) -> str:
+    def questionnaire_finalization(equity: float, bond: float, responses: list) -> str:
         """Final message after questionnaire completion."""
         return f"""Thanks! Based on your responses, here's your preliminary portfolio guidance:
 
 **Allocation:** Equity {equity:.1%}  •  Bonds {bond:.1%}
 
 **Your answers** (for your records):
-{RiskMessages._format_answers(answers)}
+{RiskMessages._format_answers(responses)}
 
 Note: This allocation is a starting point derived from your emergency savings, account concentration, time horizon (adjusted for potential withdrawals), and your stated risk preferences. If anything changes, we can revisit the questionnaire to update your allocation."""
     
     @staticmethod
-    def _format_answers(answers: dict) -> str:
-        """Format answers for display in finalization message."""
-        formatted_answers = []
-        for qid, answer in answers.items():
-            formatted_answers.append(f"- {answer['question_text']}: {answer['selected_label']}")
-        return "\n".join(formatted_answers)
-    
-    @staticmethod
-    def unknown_intent() -> str:
-        """Message for unknown or unclear intent."""
-        return """I'm not sure what you'd like to do. You can:
-• **Set your equity allocation** directly (e.g., 'set equity to 0.6')
-• **Use guidance** to determine your allocation through a questionnaire
-• **Review/edit** your current allocation if you have one set
-• **Proceed** to the next step if your risk profile is complete"""
-    
-    @staticmethod
-    def proceed_without_risk() -> str:
-        """Message when proceeding without risk allocation."""
-        return RiskMessages.mode_selection()
-    
-    @staticmethod
-    def invalid_equity() -> str:
-        """Message for invalid equity allocation."""
-        return "Please provide an equity allocation between 0.05 and 0.95 (e.g., 0.70 for 70%)."
-    
-    @staticmethod
-    def no_risk_allocation() -> str:
-        """Message when no risk allocation is set."""
-        return "No risk allocation set yet. Please set your equity allocation first."
+    def _format_answers(responses: list) -> str:
+        """Format (question text, selected label) pairs for the finalization message."""
+        return "\n".join(f"- {question_text}: {label}" for question_text, label in responses)
     
     @staticmethod
     def unknown_questionnaire_response(question_text: str, options: str) -> str:
@@ -4,26 +4,30 @@ Trading Agent Prompts
 This module contains all the prompts and system messages used by the trading agent.
 """
 
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict
 from typing import Literal, Optional, Dict
 
 # Scenario Selection Model
 class ScenarioSelectionIntent(BaseModel):
     """Intent classification for scenario selection."""
+    # Immutable so cached instances can be shared
+    model_config = ConfigDict(frozen=True)
+    
     action: Literal[
         "select_scenario",        # User wants to select a scenario
         "custom_portfolio",       # User wants to use custom portfolio
         "unknown"                 # Unclear intent
     ] = "unknown"
     
-    scenario_number: Optional[int] = Field(
-        default=None,
-        description="Scenario number (1-6) if action is select_scenario"
-    )
+    scenario_number: Optional[int] = None  # Scenario number (1-6) if action is select_scenario
 
 # Intent Classification Model
 class TradingIntent(BaseModel):
     """Intent classification for trading agent user input."""
+    # Immutable so cached instances can be shared
+    model_config = ConfigDict(frozen=True)
+    
     action: Literal[
         "set_tax_weight",         # User wants to set tax_weight parameter
         "set_ltcg_rate",          # User wants to set ltcg_rate parameter
@@ -34,28 +38,16 @@ class TradingIntent(BaseModel):
         "unknown"                 # Unclear intent
     ] = "unknown"
     
-    tax_weight: Optional[float] = Field(
-        default=None,
-        description="Tax weight value if action is set_tax_weight (e.g., '0.5' for moderate, '2' for high importance)"
-    )
-    
-    ltcg_rate: Optional[float] = Field(
-        default=None,
-        description="Long-term capital gains tax rate if action is set_ltcg_rate (range: 0 to 0.35)"
-    )
-    
-    integer_shares: Optional[bool] = Field(
-        default=None,
-        description="Integer shares flag if action is set_integer_shares (True/False)"
-    )
+    tax_weight: Optional[float] = None  # Tax weight if action is set_tax_weight
+    ltcg_rate: Optional[float] = None  # Long-term capital gains rate (0 to 0.35) if action is set_ltcg_rate
+    integer_shares: Optional[bool] = None  # Integer shares flag if action is set_integer_shares
 
 
-# Scenario selection classification prompt
-SCENARIO_SELECTION_PROMPT = """
+# Scenario selection system prompt. It contains no per-call data so the
+# whole prompt is a stable, cacheable prefix; the user input is sent as the last message.
+SCENARIO_SELECTION_SYSTEM_PROMPT = """
 You are a portfolio scenario selection assistant. Classify the user's intent from their input.
 
-User input: "{user_input}"
-
 Available scenarios: 1-6 (Conservative Retiree, Young Professional, Mid-Career Balanced, High Net Worth, New Investor, Pre-Retirement)
 
 Available actions:
@@ -75,12 +67,10 @@ Examples:
 - "hello" -> action: unknown, scenario_number: null
 """
 
-# Intent classification prompt
-INTENT_CLASSIFICATION_PROMPT = """
+# Intent classification system prompt, sent the same way as the scenario prompt
+TRADING_INTENT_SYSTEM_PROMPT = """
 You are a trading execution assistant. Classify the user's intent from their input.
 
-User input: "{user_input}"
-
 Available actions:
 - set_tax_weight: User wants to set tax weight preference (e.g., "set tax weight to 1.5", "override tax weight as 2", "tax_weight = 0.5")
 - set_ltcg_rate: User wants to set long-term capital gains tax rate (e.g., "set ltcg to 0.20", "capital gains 15%", "override capital gain as 0.16")
@@ -90,7 +80,10 @@ Available actions:
 - proceed: User wants to proceed to next phase (e.g., "proceed", "next", "continue", "looks good")
 - unknown: Intent is unclear or not related to trading configuration
 
-Extract the specific values if setting parameters. For ltcg_rate, use values between 0 and 0.35 (representing 0% to 35% tax rate).
+Extract the specific values if setting parameters (leave the others null):
+- tax_weight: a positive number (e.g., 0.5 for moderate, 2 for high importance of tax savings)
+- ltcg_rate: a value between 0 and 0.35 (representing 0% to 35% tax rate)
+- integer_shares: true for integer shares only, false to allow fractional shares
 
 Examples:
 - "set tax weight to 1.5" -> action: set_tax_weight, tax_weight: 1.5
@@ -113,6 +106,85 @@ Examples:
 """
 
 
+def build_scenario_prompt(user_input: str) -> list:
+    """Build the scenario selection messages for the given user input."""
+    return [
+        {"role": "system", "content": SCENARIO_SELECTION_SYSTEM_PROMPT},
+        {"role": "user", "content": user_input}
+    ]
+
+
+def build_intent_prompt(user_input: str) -> list:
+    """Build the intent classification messages for the given user input."""
+    return [
+        {"role": "system", "content": TRADING_INTENT_SYSTEM_PROMPT},
+        {"role": "user", "content": user_input}
+    ]
+
+
+# Message templates. The constant text is built once here and each builder
+# only formats in the current parameter values.
+_CONFIGURATION_TEMPLATE = (
+    "**Current Configuration:**\n"
+    "• Tax weight: {tax_weight}\n"
+    "• Long-term capital gains rate: {ltcg_pct:.1f}%\n"
+    "• Trading type: {shares_type}"
+)
+
+_INTRO_TEMPLATE = (
+    "I'll help you generate executable trading requests for your portfolio.\n\n"
+    + _CONFIGURATION_TEMPLATE + "\n\n"
+    "**What would you like to do?**\n"
+    "• **Adjust** parameters: say 'set tax weight to X', 'set ltcg to Y', or 'integer shares only'\n"
+    "• **Execute** trading: say 'execute' or 'run'"
+)
+
+# Review and proceed options are only shown once trades have been generated
+_INTRO_TEMPLATE_WITH_TRADES = (
+    _INTRO_TEMPLATE + "\n"
+    "• **Review** configuration: say 'review'\n"
+    "• **Proceed** with defaults: say 'proceed'"
+)
+
+_SET_SUCCESS_FOOTER = "\n\nSay 'execute' to generate trading requests or adjust other parameters."
+_TAX_WEIGHT_SET_TEMPLATE = "✅ Set tax weight to {tax_weight}.\n\n" + _CONFIGURATION_TEMPLATE + _SET_SUCCESS_FOOTER
+_LTCG_RATE_SET_TEMPLATE = "✅ Set long-term capital gains rate to {ltcg_pct:.1f}%.\n\n" + _CONFIGURATION_TEMPLATE + _SET_SUCCESS_FOOTER
+_INTEGER_SHARES_SET_TEMPLATE = "✅ Set trading type to {shares_type}.\n\n" + _CONFIGURATION_TEMPLATE + _SET_SUCCESS_FOOTER
+
+_REVIEW_CONFIGURATION_TEMPLATE = (
+    "**Current Trading Configuration:**\n\n"
+    "• **Tax weight:** {tax_weight}\n"
+    "  - Higher values prioritize tax savings over tracking error reduction\n"
+    "  - Lower values focus on minimizing tracking error\n\n"
+    "• **Long-term capital gains rate:** {ltcg_pct:.1f}%\n"
+    "  - Your expected tax rate on long-term capital gains\n\n"
+    "• **Trading type:** {shares_type}\n\n"
+    "**What would you like to do?**\n"
+    "• **Adjust** parameters\n"
+    "• **Execute** trading with these settings\n"
+    "• **Proceed** to final review"
+)
+
+_REBALANCING_SUCCESS_TEMPLATE = (
+    "✅ Trading requests generated successfully!\n\n"
+    "{trades_summary}\n\n"
+    "**Rebalancing Summary:**\n"
+    "• Initial tracking error: {initial_tracking_error:.4f}\n"
+    "• Final tracking error: {final_tracking_error:.4f}\n"
+    "• Total trades: {total_trades}\n"
+    "• Realized gains: ${realized_net_gains:.2f}\n"
+    "• Estimated tax cost: ${estimated_tax_cost:.2f}\n\n"
+    "**Next Step?**\n"
+    "• **Adjust** parameters: say 'set tax weight to X', 'set ltcg to Y', or 'integer shares only'\n"
+    "• **Review** configuration: say 'review'\n"
+    "• **Proceed** with defaults: say 'proceed'"
+)
+
+
+def _shares_type(integer_shares: bool) -> str:
+    return "Integer shares only" if integer_shares else "Fractional shares allowed"
+
+
 # System messages
 class TradingMessages:
     """Trading agent system messages and responses."""
@@ -123,6 +195,7 @@ class TradingMessages:
         return "I need the investment portfolio from the investment agent before I can generate trading requests. Please complete the investment selection first."
     
     @staticmethod
+    @lru_cache(maxsize=128)
     def intro_message(tax_weight: float, ltcg_rate: float, integer_shares: bool, has_trades: bool = False) -> str:
         """Intro message for trading agent.
         
@@ -132,47 +205,14 @@ class TradingMessages:
             integer_shares: Whether to use integer shares
             has_trades: Whether trading requests have been generated (default: False)
         """
-        shares_type = "Integer shares only" if integer_shares else "Fractional shares allowed"
-        
-        if has_trades:
-            # Show all options after trades have been generated
-            return (
-                "I'll help you generate executable trading requests for your portfolio.\n\n"
-                f"**Current Configuration:**\n"
-                f"• Tax weight: {tax_weight}\n"
-                f"• Long-term capital gains rate: {ltcg_rate*100:.1f}%\n"
-                f"• Trading type: {shares_type}\n\n"
-                f"**What would you like to do?**\n"
-                f"• **Adjust** parameters: say 'set tax weight to X', 'set ltcg to Y', or 'integer shares only'\n"
-                f"• **Execute** trading: say 'execute' or 'run'\n"
-                f"• **Review** configuration: say 'review'\n"
-                f"• **Proceed** with defaults: say 'proceed'"
-            )
-        else:
-            # Hide review and proceed options before first run
-            return (
-                "I'll help you generate executable trading requests for your portfolio.\n\n"
-                f"**Current Configuration:**\n"
-                f"• Tax weight: {tax_weight}\n"
-                f"• Long-term capital gains rate: {ltcg_rate*100:.1f}%\n"
-                f"• Trading type: {shares_type}\n\n"
-                f"**What would you like to do?**\n"
-                f"• **Adjust** parameters: say 'set tax weight to X', 'set ltcg to Y', or 'integer shares only'\n"
-                f"• **Execute** trading: say 'execute' or 'run'"
-            )
+        template = _INTRO_TEMPLATE_WITH_TRADES if has_trades else _INTRO_TEMPLATE
+        return template.format(tax_weight=tax_weight, ltcg_pct=ltcg_rate * 100, shares_type=_shares_type(integer_shares))
     
     @staticmethod
+    @lru_cache(maxsize=128)
     def tax_weight_set_success(tax_weight: float, ltcg_rate: float, integer_shares: bool) -> str:
         """Message when tax weight is successfully set."""
-        shares_type = "Integer shares only" if integer_shares else "Fractional shares allowed"
-        return (
-            f"✅ Set tax weight to {tax_weight}.\n\n"
-            f"**Current Configuration:**\n"
-            f"• Tax weight: {tax_weight}\n"
-            f"• Long-term capital gains rate: {ltcg_rate*100:.1f}%\n"
-            f"• Trading type: {shares_type}\n\n"
-            f"Say 'execute' to generate trading requests or adjust other parameters."
-        )
+        return _TAX_WEIGHT_SET_TEMPLATE.format(tax_weight=tax_weight, ltcg_pct=ltcg_rate * 100, shares_type=_shares_type(integer_shares))
     
     @staticmethod
     def tax_weight_invalid() -> str:
@@ -180,17 +220,10 @@ class TradingMessages:
         return "❌ Tax weight must be a positive number. Please try again (e.g., 'set tax weight to 1.5')."
     
     @staticmethod
+    @lru_cache(maxsize=128)
     def ltcg_rate_set_success(ltcg_rate: float, tax_weight: float, integer_shares: bool) -> str:
         """Message when ltcg rate is successfully set."""
-        shares_type = "Integer shares only" if integer_shares else "Fractional shares allowed"
-        return (
-            f"✅ Set long-term capital gains rate to {ltcg_rate*100:.1f}%.\n\n"
-            f"**Current Configuration:**\n"
-            f"• Tax weight: {tax_weight}\n"
-            f"• Long-term capital gains rate: {ltcg_rate*100:.1f}%\n"
-            f"• Trading type: {shares_type}\n\n"
-            f"Say 'execute' to generate trading requests or adjust other parameters."
-        )
+        return _LTCG_RATE_SET_TEMPLATE.format(tax_weight=tax_weight, ltcg_pct=ltcg_rate * 100, shares_type=_shares_type(integer_shares))
     
     @staticmethod
     def ltcg_rate_invalid(ltcg_rate: float) -> str:
@@ -201,35 +234,16 @@ class TradingMessages:
         )
     
     @staticmethod
+    @lru_cache(maxsize=128)
     def integer_shares_set_success(integer_shares: bool, tax_weight: float, ltcg_rate: float) -> str:
         """Message when integer shares is successfully set."""
-        shares_type = "Integer shares only" if integer_shares else "Fractional shares allowed"
-        return (
-            f"✅ Set trading type to {shares_type}.\n\n"
-            f"**Current Configuration:**\n"
-            f"• Tax weight: {tax_weight}\n"
-            f"• Long-term capital gains rate: {ltcg_rate*100:.1f}%\n"
-            f"• Trading type: {shares_type}\n\n"
-            f"Say 'execute' to generate trading requests or adjust other parameters."
-        )
+        return _INTEGER_SHARES_SET_TEMPLATE.format(tax_weight=tax_weight, ltcg_pct=ltcg_rate * 100, shares_type=_shares_type(integer_shares))
     
     @staticmethod
+    @lru_cache(maxsize=128)
     def review_configuration(tax_weight: float, ltcg_rate: float, integer_shares: bool) -> str:
         """Message for reviewing current configuration."""
-        shares_type = "Integer shares only" if integer_shares else "Fractional shares allowed"
-        return (
-            f"**Current Trading Configuration:**\n\n"
-            f"• **Tax weight:** {tax_weight}\n"
-            f"  - Higher values prioritize tax savings over tracking error reduction\n"
-            f"  - Lower values focus on minimizing tracking error\n\n"
-            f"• **Long-term capital gains rate:** {ltcg_rate*100:.1f}%\n"
-            f"  - Your expected tax rate on long-term capital gains\n\n"
-            f"• **Trading type:** {shares_type}\n\n"
-            f"**What would you like to do?**\n"
-            f"• **Adjust** parameters\n"
-            f"• **Execute** trading with these settings\n"
-            f"• **Proceed** to final review"
-        )
+        return _REVIEW_CONFIGURATION_TEMPLATE.format(tax_weight=tax_weight, ltcg_pct=ltcg_rate * 100, shares_type=_shares_type(integer_shares))
     
     @staticmethod
     def rebalancing_in_progress() -> str:
@@ -239,19 +253,13 @@ class TradingMessages:
     @staticmethod
     def rebalancing_success(trades_summary: str, result_summary) -> str:
         """Message when rebalancing is successful."""
-        return (
-            f"✅ Trading requests generated successfully!\n\n"
-            f"{trades_summary}\n\n"
-            f"**Rebalancing Summary:**\n"
-            f"• Initial tracking error: {result_summary.get('initial_tracking_error', 0):.4f}\n"
-            f"• Final tracking error: {result_summary.get('final_tracking_error', 0):.4f}\n"
-            f"• Total trades: {len(result_summary.get('trades', []))}\n"
-            f"• Realized gains: ${result_summary.get('realized_net_gains', 0):.2f}\n"
-            f"• Estimated tax cost: ${result_summary.get('estimated_tax_cost', 0):.2f}\n\n"
-            f"**Next Step?**\n"
-            f"• **Adjust** parameters: say 'set tax weight to X', 'set ltcg to Y', or 'integer shares only'\n"
-            f"• **Review** configuration: say 'review'\n"
-            f"• **Proceed** with defaults: say 'proceed'"
+        return _REBALANCING_SUCCESS_TEMPLATE.format(
+            trades_summary=trades_summary,
+            initial_tracking_error=result_summary.get('initial_tracking_error', 0),
+            final_tracking_error=result_summary.get('final_tracking_error', 0),
+            total_trades=len(result_summary.get('trades', [])),
+            realized_net_gains=result_summary.get('realized_net_gains', 0),
+            estimated_tax_cost=result_summary.get('estimated_tax_cost', 0)
         )
     
     @staticmethod
@@ -1,8 +1,13 @@
 from typing import TypedDict, List, Dict, Any, Optional
+from types import MappingProxyType
+
+# Status of an agent with no status_tracking entry yet. Read-only and shared;
+# build new entries with dict(DEFAULT_STATUS).
+DEFAULT_STATUS = MappingProxyType({"done": False, "awaiting_input": False})
 
 class AgentState(TypedDict, total=False):
     messages: List[Dict[str, Any]]
-    answers: Dict[str, Dict[str, Any]]   # qid -> MCAnswer as dict
+    answers: Dict[str, Dict[str, Any]]   # qid -> {"selected_index", "selected_label"}
     risk: Optional[Dict[str, float]]
     intent_to_risk: bool
     entry_greeted: bool
@@ -0,0 +1,153 @@
+"""
+Unit tests for shared BaseAgent behavior
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import threading
+import time
+import unittest
+from langchain_core.runnables import RunnableLambda
+from langgraph.graph import StateGraph, END
+from agents.base_agent import BaseAgent
+from state import AgentState
+
+
+class _CountingAgent(BaseAgent):
+    """Agent whose step records how many calls overlap."""
+    
+    def __init__(self):
+        super().__init__(llm=None, agent_name="counting")
+        self._guard = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+    
+    def step(self, state):
+        with self._guard:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self._guard:
+            self.active -= 1
+            self.calls += 1
+        return state
+    
+    def router(self, state):
+        return "__end__"
+
+
+class TestBaseAgentAsync(unittest.TestCase):
+    """Test cases for BaseAgent.astep."""
+    
+    def test_ainvoke_runs_step(self):
+        """Test that a node built like app.py runs step through ainvoke."""
+        agent = _CountingAgent()
+        node = RunnableLambda(agent.step, afunc=agent.astep)
+        state = {"messages": []}
+        result = asyncio.run(node.ainvoke(state))
+        self.assertIs(result, state)
+        self.assertEqual(agent.calls, 1)
+    
+    def test_concurrent_calls_are_serialized(self):
+        """Test that overlapping ainvoke calls never run step at the same time."""
+        agent = _CountingAgent()
+        node = RunnableLambda(agent.step, afunc=agent.astep)
+        
+        async def run_all():
+            return await asyncio.gather(*(node.ainvoke({"messages": []}) for _ in range(5)))
+        
+        asyncio.run(run_all())
+        self.assertEqual(agent.calls, 5)
+        self.assertEqual(agent.max_active, 1)
+
+
+class TestCacheClassifier(unittest.TestCase):
+    """Test cases for BaseAgent._cache_classifier."""
+    
+    def setUp(self):
+        """Set up a classifier that records the inputs it is called with."""
+        self.agent = _CountingAgent()
+        self.failure = object()
+        self.seen = []
+        self.fail = False
+        
+        def classify(user_input, *context):
+            self.seen.append((user_input, *context))
+            return self.failure if self.fail else (user_input, *context)
+        
+        self.lookup = self.agent._cache_classifier(classify, self.failure)
+    
+    def test_repeated_input_hits_cache(self):
+        """Test that a repeated input is answered without calling the classifier."""
+        first = self.lookup("review")
+        second = self.lookup("review")
+        self.assertIs(first, second)
+        self.assertEqual(len(self.seen), 1)
+        self.assertEqual(self.lookup.cache_info().hits, 1)
+    
+    def test_key_is_stripped_input_and_context(self):
+        """Test that surrounding whitespace is ignored and context is part of the key."""
+        self.lookup("  review \n")
+        self.lookup("review")
+        self.assertEqual(self.seen, [("review",)])
+        self.lookup("review", True)
+        self.assertEqual(self.seen[-1], ("review", True))
+        self.assertEqual(len(self.seen), 2)
+    
+    def test_failure_intent_is_not_cached(self):
+        """Test that returning the failure sentinel clears the cache."""
+        self.lookup("review")
+        self.fail = True
+        self.assertIs(self.lookup("hello"), self.failure)
+        self.assertEqual(self.lookup.cache_info().currsize, 0)
+        self.fail = False
+        self.lookup("hello")
+        self.assertEqual(self.seen, [("review",), ("hello",), ("hello",)])
+
+
+class _ProgressAgent(_CountingAgent):
+    """Agent that emits a progress note before a slow step finishes."""
+    
+    def step(self, state):
+        self._emit_progress("working")
+        return super().step(state)
+
+
+class TestEmitProgress(unittest.TestCase):
+    """Test cases for BaseAgent._emit_progress."""
+    
+    def setUp(self):
+        """Build a one-node graph the way app.py builds nodes."""
+        self.agent = _ProgressAgent()
+        builder = StateGraph(AgentState)
+        builder.add_node("agent", RunnableLambda(self.agent.step, afunc=self.agent.astep))
+        builder.set_entry_point("agent")
+        builder.add_edge("agent", END)
+        self.graph = builder.compile()
+    
+    def test_progress_streamed_before_result(self):
+        """Test that the note arrives on the custom stream ahead of the state, outside messages."""
+        chunks = list(self.graph.stream({"messages": []}, stream_mode=["custom", "values"]))
+        self.assertIn(("custom", {"agent": "counting", "progress": "working"}), chunks)
+        modes = [mode for mode, _ in chunks]
+        self.assertLess(modes.index("custom"), len(modes) - 1)
+        self.assertEqual(chunks[-1][1]["messages"], [])
+        
+        async def collect():
+            return [mode async for mode, _ in self.graph.astream({"messages": []}, stream_mode=["custom", "values"])]
+        
+        self.assertEqual(asyncio.run(collect())[-2:], ["custom", "values"])
+    
+    def test_outside_graph_is_noop(self):
+        """Test that calling step directly does not require a graph context."""
+        state = {"messages": []}
+        self.assertIs(self.agent.step(state), state)
+        self.assertEqual(state["messages"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
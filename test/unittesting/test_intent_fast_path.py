@@ -0,0 +1,196 @@
+"""
+Unit tests for the rule-based intent fast paths used before LLM classification
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from agents.portfolio_agent import match_intent_keywords as match_portfolio_intent
+from agents.investment_agent import match_intent_keywords as match_investment_intent
+from agents.entry_agent import match_intent_keywords as match_entry_intent
+from agents.reviewer_agent import match_intent_keywords as match_reviewer_intent
+from agents.risk_agent import match_intent_keywords as match_risk_intent
+from agents.trading_agent import match_intent_keywords as match_trading_intent, match_scenario_keywords
+
+
+class TestPortfolioIntentFastPath(unittest.TestCase):
+    """Test cases for the portfolio agent keyword classifier."""
+    
+    def test_simple_commands(self):
+        """Test that canonical one-word commands are classified."""
+        self.assertEqual(match_portfolio_intent("run").action, "run_optimization")
+        self.assertEqual(match_portfolio_intent("Optimize!").action, "run_optimization")
+        self.assertEqual(match_portfolio_intent(" proceed ").action, "proceed")
+        self.assertEqual(match_portfolio_intent("review").action, "review")
+    
+    def test_parameter_values_extracted(self):
+        """Test that lambda and cash values are captured."""
+        intent = match_portfolio_intent("set lambda to 1.5")
+        self.assertEqual(intent.action, "set_lambda")
+        self.assertEqual(intent.lambda_value, 1.5)
+        
+        intent = match_portfolio_intent("cash .03")
+        self.assertEqual(intent.action, "set_cash")
+        self.assertAlmostEqual(intent.cash_value, 0.03)
+        
+        intent = match_portfolio_intent("set cash reserve = 0.02")
+        self.assertEqual(intent.action, "set_cash")
+        self.assertAlmostEqual(intent.cash_value, 0.02)
+    
+    def test_cash_value_normalized_to_fraction(self):
+        """Test that percent, bare whole-number and decimal cash values all become fractions."""
+        self.assertAlmostEqual(match_portfolio_intent("cash 3").cash_value, 0.03)
+        self.assertAlmostEqual(match_portfolio_intent("cash reserve 5").cash_value, 0.05)
+        self.assertAlmostEqual(match_portfolio_intent("cash 5%").cash_value, 0.05)
+        self.assertAlmostEqual(match_portfolio_intent("set cash to 2.5 %").cash_value, 0.025)
+        self.assertAlmostEqual(match_portfolio_intent("cash 0.04").cash_value, 0.04)
+        self.assertAlmostEqual(match_portfolio_intent("cash 1").cash_value, 0.01)
+        self.assertAlmostEqual(match_portfolio_intent("cash 2.5").cash_value, 0.025)
+    
+    def test_prompt_examples(self):
+        """Test that the prompt's few-shot examples are answered directly."""
+        self.assertEqual(match_portfolio_intent("Looks good!").action, "proceed")
+        self.assertEqual(match_portfolio_intent("I'm satisfied").action, "proceed")
+    
+    def test_conversational_input_falls_through(self):
+        """Test that anything beyond a canonical command is left to the LLM."""
+        self.assertIsNone(match_portfolio_intent("don't run yet"))
+        self.assertIsNone(match_portfolio_intent("looks good to me"))
+        self.assertIsNone(match_portfolio_intent("set lambda"))
+        self.assertIsNone(match_portfolio_intent(""))
+
+
+
+class TestInvestmentIntentFastPath(unittest.TestCase):
+    """Test cases for the investment agent asset class lookup."""
+    
+    def test_asset_class_name(self):
+        """Test that a bare asset class name maps to edit_asset_class."""
+        intent = match_investment_intent("Large Cap Value")
+        self.assertEqual(intent.action, "edit_asset_class")
+        self.assertEqual(intent.asset_class, "large_cap_value")
+        self.assertEqual(match_investment_intent("emerging market").asset_class, "emerging_market_equity")
+    
+    def test_analyze_ticker(self):
+        """Test that 'analyze TICKER' maps to analyze_fund."""
+        intent = match_investment_intent("analyze VUG")
+        self.assertEqual(intent.action, "analyze_fund")
+        self.assertEqual(intent.ticker, "VUG")
+        self.assertEqual(match_investment_intent("Tell me about SPY?").ticker, "SPY")
+    
+    def test_other_input_falls_through(self):
+        """Test that other input is left to the LLM."""
+        self.assertIsNone(match_investment_intent("analyze this"))
+        self.assertIsNone(match_investment_intent("analyze VUG and VTI"))
+        self.assertIsNone(match_investment_intent("analyze IT"))
+        self.assertIsNone(match_investment_intent("tell me about US"))
+        self.assertIsNone(match_investment_intent("change large cap value please"))
+
+
+class TestEntryIntentFastPath(unittest.TestCase):
+    """Test cases for the entry agent proceed word lookup."""
+    
+    def test_proceed_words(self):
+        """Test that one-word proceed replies are classified."""
+        self.assertEqual(match_entry_intent("yes").action, "proceed")
+        self.assertEqual(match_entry_intent(" OK! ").action, "proceed")
+        self.assertEqual(match_entry_intent("next.").action, "proceed")
+    
+    def test_other_input_falls_through(self):
+        """Test that questions and longer replies are left to the LLM."""
+        self.assertIsNone(match_entry_intent("what is risk assessment?"))
+        self.assertIsNone(match_entry_intent("yes but first explain trading"))
+
+
+
+class TestReviewerIntentFastPath(unittest.TestCase):
+    """Test cases for the reviewer agent pattern table."""
+    
+    def test_canonical_replies(self):
+        """Test that start over and finish replies are classified."""
+        self.assertEqual(match_reviewer_intent("Start over").action, "start_over")
+        self.assertEqual(match_reviewer_intent("new portfolio!").action, "start_over")
+        self.assertEqual(match_reviewer_intent("thank you").action, "finish")
+        self.assertEqual(match_reviewer_intent(" done ").action, "finish")
+        self.assertEqual(match_reviewer_intent("new").action, "start_over")
+        self.assertEqual(match_reviewer_intent("End.").action, "finish")
+    
+    def test_other_input_falls_through(self):
+        """Test that other input is left to the LLM."""
+        self.assertIsNone(match_reviewer_intent("I'm not done yet"))
+        self.assertIsNone(match_reviewer_intent("hello"))
+
+
+
+class TestRiskIntentFastPath(unittest.TestCase):
+    """Test cases for the risk agent equity pattern and keywords."""
+    
+    def test_direct_equity(self):
+        """Test that percentages and decimals become set_equity."""
+        for text in ("60%", "0.6", ".6", "set as 0.6", "set equity to 60%", "equity 0.60"):
+            intent = match_risk_intent(text)
+            self.assertEqual(intent.action, "set_equity", text)
+            self.assertAlmostEqual(intent.equity_value, 0.6)
+    
+    def test_keywords(self):
+        """Test that one-word commands are classified."""
+        self.assertEqual(match_risk_intent("Proceed").action, "proceed")
+        self.assertEqual(match_risk_intent("edit").action, "review_edit")
+        self.assertEqual(match_risk_intent("use guidance").action, "use_guidance")
+        self.assertEqual(match_risk_intent("Done!").action, "proceed")
+        self.assertEqual(match_risk_intent("help me decide").action, "use_guidance")
+    
+    def test_other_input_falls_through(self):
+        """Test that option numbers, out-of-range values and sentences go to the LLM."""
+        self.assertIsNone(match_risk_intent("1"))
+        self.assertIsNone(match_risk_intent("150%"))
+        self.assertIsNone(match_risk_intent("I want to be aggressive"))
+
+
+class TestTradingIntentFastPath(unittest.TestCase):
+    """Test cases for the trading agent intent and scenario classifiers."""
+    
+    def test_keywords(self):
+        """Test that canonical commands are classified."""
+        self.assertEqual(match_trading_intent("Execute").action, "run_rebalancing")
+        self.assertEqual(match_trading_intent("generate  trades").action, "run_rebalancing")
+        self.assertEqual(match_trading_intent("review").action, "review")
+        self.assertEqual(match_trading_intent("looks good!").action, "proceed")
+    
+    def test_parameter_values_extracted(self):
+        """Test that tax weight, ltcg rate and share settings are captured."""
+        self.assertEqual(match_trading_intent("set tax weight to 1.5").tax_weight, 1.5)
+        self.assertEqual(match_trading_intent("tax_weight = 0.5").tax_weight, 0.5)
+        self.assertAlmostEqual(match_trading_intent("set ltcg to 0.20").ltcg_rate, 0.20)
+        self.assertAlmostEqual(match_trading_intent("capital gains 15%").ltcg_rate, 0.15)
+        self.assertTrue(match_trading_intent("integer shares only").integer_shares)
+        self.assertFalse(match_trading_intent("allow fractional shares").integer_shares)
+    
+    def test_ltcg_rate_normalized_to_fraction(self):
+        """Test that percent, bare whole-number and decimal rates all become fractions."""
+        self.assertAlmostEqual(match_trading_intent("ltcg 20").ltcg_rate, 0.20)
+        self.assertAlmostEqual(match_trading_intent("ltcg 20%").ltcg_rate, 0.20)
+        self.assertAlmostEqual(match_trading_intent("ltcg 0.2").ltcg_rate, 0.20)
+        self.assertAlmostEqual(match_trading_intent("set ltcg to 20").ltcg_rate, 0.20)
+        self.assertAlmostEqual(match_trading_intent("capital gains 15").ltcg_rate, 0.15)
+        self.assertAlmostEqual(match_trading_intent("ltcg 1").ltcg_rate, 0.01)
+        self.assertAlmostEqual(match_trading_intent("capital gains rate 1").ltcg_rate, 0.01)
+        self.assertAlmostEqual(match_trading_intent("ltcg 20.5").ltcg_rate, 0.205)
+    
+    def test_scenario_selection(self):
+        """Test that scenario numbers and 'custom' are classified."""
+        self.assertEqual(match_scenario_keywords(" 3 ").scenario_number, 3)
+        self.assertEqual(match_scenario_keywords("choose scenario 5").scenario_number, 5)
+        self.assertEqual(match_scenario_keywords("custom").action, "custom_portfolio")
+        self.assertIsNone(match_scenario_keywords("7"))
+    
+    def test_other_input_falls_through(self):
+        """Test that questions and sentences go to the LLM."""
+        self.assertIsNone(match_trading_intent("what tax weight should I use?"))
+        self.assertIsNone(match_trading_intent("hello"))
+
+
+if __name__ == '__main__':
+    unittest.main()
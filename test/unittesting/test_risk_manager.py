@@ -8,6 +8,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import unittest
 from utils.risk.risk_manager import RiskManager
+from utils.risk.config import GLIDEPATH_DATA, get_glidepath
 
 
 class TestRiskManager(unittest.TestCase):
@@ -93,6 +94,15 @@ class TestRiskManager(unittest.TestCase):
         
         with self.assertRaises(ValueError):
             self.manager.calculate_risk_allocation(answers)
+    
+    def test_get_glidepath_matches_table(self):
+        """Test that the flattened glidepath agrees with GLIDEPATH_DATA and clamps horizons."""
+        for horizon, row in GLIDEPATH_DATA.items():
+            for path in range(1, 5):
+                self.assertEqual(get_glidepath(horizon, path), row[f"Path {path}"])
+        self.assertEqual(get_glidepath(45, 2), GLIDEPATH_DATA[30]["Path 2"])
+        with self.assertRaises(ValueError):
+            get_glidepath(10, 5)
 
 
 if __name__ == '__main__':
@@ -17,6 +17,8 @@ from test.unittesting.test_risk_manager import TestRiskManager
 from test.unittesting.test_portfolio_manager import TestPortfolioManager
 from test.unittesting.test_fund_analyzer import TestFundAnalyzer
 from test.unittesting.test_rebalancer import TestSoftObjectiveRebalancer
+from test.unittesting.test_base_agent import TestBaseAgentAsync, TestCacheClassifier, TestEmitProgress
+from test.unittesting.test_intent_fast_path import TestPortfolioIntentFastPath, TestInvestmentIntentFastPath, TestEntryIntentFastPath, TestReviewerIntentFastPath, TestRiskIntentFastPath, TestTradingIntentFastPath
 
 
 def run_all_tests():
@@ -30,6 +32,15 @@ def run_all_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestPortfolioManager))
     suite.addTests(loader.loadTestsFromTestCase(TestFundAnalyzer))
     suite.addTests(loader.loadTestsFromTestCase(TestSoftObjectiveRebalancer))
+    suite.addTests(loader.loadTestsFromTestCase(TestPortfolioIntentFastPath))
+    suite.addTests(loader.loadTestsFromTestCase(TestInvestmentIntentFastPath))
+    suite.addTests(loader.loadTestsFromTestCase(TestEntryIntentFastPath))
+    suite.addTests(loader.loadTestsFromTestCase(TestReviewerIntentFastPath))
+    suite.addTests(loader.loadTestsFromTestCase(TestRiskIntentFastPath))
+    suite.addTests(loader.loadTestsFromTestCase(TestTradingIntentFastPath))
+    suite.addTests(loader.loadTestsFromTestCase(TestBaseAgentAsync))
+    suite.addTests(loader.loadTestsFromTestCase(TestCacheClassifier))
+    suite.addTests(loader.loadTestsFromTestCase(TestEmitProgress))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
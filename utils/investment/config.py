@@ -30,6 +30,23 @@ ASSET_CLASS_FUNDS = {
     "cash": ["BIL", "SHV", "BIL", "SCHO"]
 }
 
+# Mapping of user-facing asset class names to asset class keys
+# Used both in the intent classification prompt and for direct lookups
+ASSET_CLASS_ALIASES = {
+    "large cap growth": "large_cap_growth",
+    "large cap value": "large_cap_value",
+    "small cap growth": "small_cap_growth",
+    "small cap value": "small_cap_value",
+    "developed market": "developed_market_equity",
+    "emerging market": "emerging_market_equity",
+    "short term treasury": "short_term_treasury",
+    "mid term treasury": "mid_term_treasury",
+    "long term treasury": "long_term_treasury",
+    "corporate bond": "corporate_bond",
+    "tips": "tips",
+    "cash": "cash"
+}
+
 # =============================================================================
 # FUND SELECTION CRITERIA
 # =============================================================================
@@ -103,6 +120,10 @@ def get_fund_options(asset_class: str) -> list:
     """Get available fund options for an asset class"""
     return ASSET_CLASS_FUNDS.get(asset_class, [])
 
+def get_asset_class_from_alias(name: str) -> str:
+    """Get the asset class key for a user-facing asset class name, or None"""
+    return ASSET_CLASS_ALIASES.get(name.lower().strip())
+
 def get_selection_criteria(criteria: str) -> dict:
     """Get selection criteria configuration"""
     return SELECTION_CRITERIA.get(criteria, {})
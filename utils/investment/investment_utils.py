@@ -5,8 +5,7 @@ This module contains all the utility functions used by the investment agent,
 separated from the main agent logic for better organization and reusability.
 """
 
-from typing import Dict, Any, List, Optional
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from utils.investment.fund_analyzer import FundAnalyzer
 import yfinance as yf
 from utils.investment.config import (
@@ -14,15 +13,29 @@ from utils.investment.config import (
     get_selection_criteria, 
     is_cash_position, 
     get_cash_config,
-    ASSET_CLASS_FUNDS
+    ASSET_CLASS_FUNDS,
+    ASSET_CLASS_ALIASES
 )
-from prompts.investment_prompts import InvestmentMessages
+from prompts.investment_prompts import (
+    InvestmentMessages,
+    CRITERIA_SELECTION_MESSAGE,
+    INVALID_CRITERIA_SELECTION_MESSAGE,
+    FUND_ANALYSIS_PROMPT,
+    PORTFOLIO_DISPLAY_HEADER,
+    PORTFOLIO_DISPLAY_FOOTER,
+    NEXT_STEPS_OPTIONS,
+    FUND_ANALYSIS_PERFORMANCE_HEADER,
+    FUND_ANALYSIS_MANAGEMENT_HEADER
+)
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 
 class InvestmentUtils:
     """Utility class containing all investment-related helper functions."""
     
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: "ChatOpenAI"):
         """Initialize the InvestmentUtils."""
         self.llm = llm
         self.fund_analyzer = FundAnalyzer()
@@ -31,7 +44,7 @@ class InvestmentUtils:
         # Ask user to choose selection criteria
         state["messages"].append({
             "role": "ai",
-            "content": InvestmentMessages.criteria_selection_message()
+            "content": CRITERIA_SELECTION_MESSAGE
         })
         
         return state
@@ -53,7 +66,7 @@ class InvestmentUtils:
         if not criteria:
             state["messages"].append({
                 "role": "ai",
-                "content": InvestmentMessages.invalid_criteria_selection()
+                "content": INVALID_CRITERIA_SELECTION_MESSAGE
             })
             return state
         
@@ -169,24 +182,8 @@ class InvestmentUtils:
     
     def extract_asset_class(self, user_input: str) -> Optional[str]:
         """Extract asset class name from user input."""
-        # Map common user terms to asset class names
-        asset_class_mapping = {
-            "large cap growth": "large_cap_growth",
-            "large cap value": "large_cap_value", 
-            "small cap growth": "small_cap_growth",
-            "small cap value": "small_cap_value",
-            "developed market": "developed_market_equity",
-            "emerging market": "emerging_market_equity",
-            "short term treasury": "short_term_treasury",
-            "mid term treasury": "mid_term_treasury", 
-            "long term treasury": "long_term_treasury",
-            "corporate bond": "corporate_bond",
-            "tips": "tips",
-            "cash": "cash"
-        }
-        
         user_input_lower = user_input.lower()
-        for user_term, asset_class in asset_class_mapping.items():
+        for user_term, asset_class in ASSET_CLASS_ALIASES.items():
             if user_term in user_input_lower:
                 return asset_class
         
@@ -208,7 +205,7 @@ class InvestmentUtils:
         if not ticker:
             state["messages"].append({
                 "role": "ai",
-                "content": InvestmentMessages.fund_analysis_prompt()
+                "content": FUND_ANALYSIS_PROMPT
             })
             return state
         
@@ -265,13 +262,14 @@ class InvestmentUtils:
         criteria_config = get_selection_criteria(criteria_used)
         criteria_name = criteria_config.get("name", criteria_used) if criteria_config else criteria_used
         
-        reasoning_text = f"\n{InvestmentMessages.selection_criteria_header(criteria_name)}\n"
+        reasoning_parts = [f"\n{InvestmentMessages.selection_criteria_header(criteria_name)}\n"]
         for asset_class, data in investment.items():
             if data.get("selection_reason"):
                 display_name = asset_class.replace("_", " ").title()
-                reasoning_text += f"• {display_name}: {data['selection_reason']}\n"
+                reasoning_parts.append(f"• {display_name}: {data['selection_reason']}\n")
+        reasoning_text = "".join(reasoning_parts)
         
-        portfolio_message = f"{InvestmentMessages.portfolio_display_header()}\n\n{table_text}\n\n{InvestmentMessages.portfolio_display_footer()}\n\n{reasoning_text}\n\n{InvestmentMessages.next_steps_options()}"
+        portfolio_message = f"{PORTFOLIO_DISPLAY_HEADER}\n\n{table_text}\n\n{PORTFOLIO_DISPLAY_FOOTER}\n\n{reasoning_text}\n\n{NEXT_STEPS_OPTIONS}"
         
         state["messages"].append({
             "role": "ai",
@@ -375,41 +373,41 @@ class InvestmentUtils:
             performance = analysis.get("performance_metrics", {})
             management = analysis.get("management_metrics", {})
             
-            summary = InvestmentMessages.fund_analysis_header(ticker) + "\n\n"
+            parts = [InvestmentMessages.fund_analysis_header(ticker), "\n\n"]
             
             # Basic info
-            summary += InvestmentMessages.fund_analysis_basic_info(
+            parts.append(InvestmentMessages.fund_analysis_basic_info(
                 fund_info.get("name"),
                 fund_info.get("category"),
                 management.get("expense_ratio"),
                 management.get("aum")
-            )
+            ))
             
-            summary += f"\n{InvestmentMessages.fund_analysis_performance_header()}\n"
+            parts.append(f"\n{FUND_ANALYSIS_PERFORMANCE_HEADER}\n")
             if performance.get("annualized_return"):
-                summary += f"• Annualized Return: {performance['annualized_return']:.2f}%\n"
+                parts.append(f"• Annualized Return: {performance['annualized_return']:.2f}%\n")
             if performance.get("volatility"):
-                summary += f"• Volatility: {performance['volatility']:.2f}%\n"
+                parts.append(f"• Volatility: {performance['volatility']:.2f}%\n")
             if performance.get("sharpe_ratio"):
-                summary += f"• Sharpe Ratio: {performance['sharpe_ratio']:.2f}\n"
+                parts.append(f"• Sharpe Ratio: {performance['sharpe_ratio']:.2f}\n")
             if performance.get("max_drawdown"):
-                summary += f"• Max Drawdown: {performance['max_drawdown']:.2f}%\n"
+                parts.append(f"• Max Drawdown: {performance['max_drawdown']:.2f}%\n")
             if performance.get("beta"):
-                summary += f"• Beta: {performance['beta']:.2f}\n"
+                parts.append(f"• Beta: {performance['beta']:.2f}\n")
             
-            summary += f"\n{InvestmentMessages.fund_analysis_management_header()}\n"
+            parts.append(f"\n{FUND_ANALYSIS_MANAGEMENT_HEADER}\n")
             if management.get("expense_ratio"):
-                summary += f"• Expense Ratio: {management['expense_ratio']:.2%}\n"
+                parts.append(f"• Expense Ratio: {management['expense_ratio']:.2%}\n")
             if management.get("aum"):
-                summary += f"• Assets Under Management: ${management['aum']:,.0f}\n"
+                parts.append(f"• Assets Under Management: ${management['aum']:,.0f}\n")
             if management.get("fund_age_years"):
-                summary += f"• Fund Age: {management['fund_age_years']:.1f} years\n"
+                parts.append(f"• Fund Age: {management['fund_age_years']:.1f} years\n")
             if management.get("fund_family"):
-                summary += f"• Fund Family: {management['fund_family']}\n"
+                parts.append(f"• Fund Family: {management['fund_family']}\n")
             
-            summary += f"\n{InvestmentMessages.fund_analysis_data_quality(analysis.get('data_quality', 'Unknown'))}"
+            parts.append(f"\n{InvestmentMessages.fund_analysis_data_quality(analysis.get('data_quality', 'Unknown'))}")
             
-            return summary
+            return "".join(parts)
             
         except Exception as e:
             return InvestmentMessages.fund_analysis_error(ticker, str(e))
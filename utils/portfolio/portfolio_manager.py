@@ -1,13 +1,15 @@
 from __future__ import annotations
-from typing import Dict, List, Tuple, Callable, Any
+from typing import Dict, List, Tuple, Callable, Any, TYPE_CHECKING
 import numpy as np
 import pandas as pd
 import os
 import json
 from langchain.tools import tool
-from langchain_openai import ChatOpenAI
 from utils.portfolio.config import get_expected_returns, get_covariance_matrix, ASSET_CLASSES, get_cash_reserve_constraints, validate_cash_reserve, DEFAULT_LAMBDA, DEFAULT_CASH_RESERVE
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 
 class PortfolioManager:
     """
@@ -3,8 +3,44 @@ Reviewer utilities for generating summaries and managing reviewer logic
 """
 
 from typing import Dict, Any, List, Optional, Tuple
-from state import AgentState
-from prompts.reviewer_prompts import REVIEWER_VALIDATION_PROMPTS
+from state import AgentState, DEFAULT_STATUS
+from prompts.reviewer_prompts import REVIEWER_VALIDATION_PROMPTS, FINAL_COMPLETION_MESSAGE_TEMPLATE
+
+# Workflow phases in the order they are completed
+PHASES = ("risk", "portfolio", "investment", "trading")
+
+# phase -> (state key holding the phase output, completeness check on a non-empty output)
+_PHASE_CHECKS = {
+    "risk": ("risk", lambda risk: "equity" in risk and "bond" in risk),
+    "portfolio": ("portfolio", lambda portfolio: isinstance(portfolio, dict)),
+    "investment": ("investment", lambda investment: isinstance(investment, dict)),
+    "trading": ("trading_requests", lambda trading: isinstance(trading, dict) and bool(trading.get("trading_requests"))),
+}
+
+# Agents with a status_tracking entry; each gets its own copy of DEFAULT_STATUS
+_TRACKED_AGENTS = PHASES + ("reviewer",)
+
+# Scalar state values restored by reset_state; the nested dicts are rebuilt per reset
+_RESET_VALUES = {
+    "risk": None,
+    "portfolio": None,
+    "investment": None,
+    "trading_requests": None,
+    "all_phases_complete": False,
+    "ready_to_proceed": None,
+    "next_phase": "risk",  # Reset to first phase
+    "intent_to_risk": False,
+    "intent_to_portfolio": False,
+    "intent_to_investment": False,
+    "intent_to_trading": False,
+    "entry_greeted": False,
+}
+
+# phase -> (complete feedback, incomplete feedback), resolved once from the static prompts
+_PHASE_FEEDBACK = {
+    phase: (REVIEWER_VALIDATION_PROMPTS[phase]["complete"], REVIEWER_VALIDATION_PROMPTS[phase]["incomplete"])
+    for phase in PHASES
+}
 
 
 class ReviewerUtils:
@@ -122,26 +158,7 @@ class ReviewerUtils:
         """
         portfolio_summary = ReviewerUtils.generate_portfolio_summary(state)
         
-        return f"""🎉 **Portfolio Planning Complete!**
-
-Congratulations! You have successfully completed all phases of the robo-advisor process:
-
-✅ **Risk Assessment** - Your risk tolerance and asset allocation
-✅ **Portfolio Construction** - Optimized asset class weights  
-✅ **Investment Selection** - Specific funds and ETFs chosen
-✅ **Trading Requests** - Ready-to-execute trading orders
-
----
-
-## 📊 **Your Complete Portfolio Summary**
-
-{portfolio_summary}
-
----
-
-**What's Next?**
-
-Type **"proceed"** to confirm acknowledgement of the summary."""
+        return FINAL_COMPLETION_MESSAGE_TEMPLATE.format(portfolio_summary=portfolio_summary)
 
     @staticmethod
     def validate_phase_completion(state: AgentState, phase: str) -> Tuple[bool, str]:
@@ -155,31 +172,16 @@ Type **"proceed"** to confirm acknowledgement of the summary."""
         Returns:
             Tuple of (is_complete, feedback_message)
         """
-        if phase == "risk":
-            risk = state.get("risk")
-            if risk and "equity" in risk and "bond" in risk:
-                return True, REVIEWER_VALIDATION_PROMPTS["risk"]["complete"]
-            return False, REVIEWER_VALIDATION_PROMPTS["risk"]["incomplete"]
-        
-        elif phase == "portfolio":
-            portfolio = state.get("portfolio")
-            if portfolio and isinstance(portfolio, dict) and len(portfolio) > 0:
-                return True, REVIEWER_VALIDATION_PROMPTS["portfolio"]["complete"]
-            return False, REVIEWER_VALIDATION_PROMPTS["portfolio"]["incomplete"]
+        check = _PHASE_CHECKS.get(phase)
+        if check is None:
+            return False, f"Unknown phase: {phase}"
         
-        elif phase == "investment":
-            investment = state.get("investment")
-            if investment and isinstance(investment, dict) and len(investment) > 0:
-                return True, REVIEWER_VALIDATION_PROMPTS["investment"]["complete"]
-            return False, REVIEWER_VALIDATION_PROMPTS["investment"]["incomplete"]
-        
-        elif phase == "trading":
-            trading = state.get("trading_requests")
-            if trading and isinstance(trading, dict) and "trading_requests" in trading and len(trading.get("trading_requests", [])) > 0:
-                return True, REVIEWER_VALIDATION_PROMPTS["trading"]["complete"]
-            return False, REVIEWER_VALIDATION_PROMPTS["trading"]["incomplete"]
-        
-        return False, f"Unknown phase: {phase}"
+        state_key, is_complete = check
+        complete_feedback, incomplete_feedback = _PHASE_FEEDBACK[phase]
+        output = state.get(state_key)
+        if output and is_complete(output):
+            return True, complete_feedback
+        return False, incomplete_feedback
 
     @staticmethod
     def get_next_phase(state: AgentState) -> Optional[str]:
@@ -192,9 +194,7 @@ Type **"proceed"** to confirm acknowledgement of the summary."""
         Returns:
             Next phase name or None if all complete
         """
-        phases = ["risk", "portfolio", "investment", "trading"]
-        
-        for phase in phases:
+        for phase in PHASES:
             is_complete, _ = ReviewerUtils.validate_phase_completion(state, phase)
             if not is_complete:
                 return phase
@@ -213,27 +213,11 @@ Type **"proceed"** to confirm acknowledgement of the summary."""
         Returns:
             First incomplete phase name or None
         """
-        incomplete_phases = [phase for phase, (is_complete, _) in validation_results.items() if not is_complete]
-        
-        if not incomplete_phases:
-            return None
-        
-        # Find the first incomplete phase that has been started
-        started_phases = []
-        if state.get("risk"):
-            started_phases.append("risk")
-        if state.get("portfolio"):
-            started_phases.append("portfolio")
-        if state.get("investment"):
-            started_phases.append("investment")
-        if state.get("trading_requests"):
-            started_phases.append("trading")
-        
-        # Find incomplete phases that have been started
-        incomplete_started_phases = [phase for phase in incomplete_phases if phase in started_phases]
-        
-        if incomplete_started_phases:
-            return incomplete_started_phases[0]
+        # Single pass in validation order; a phase counts as started once its output is in state
+        for phase, (is_complete, _) in validation_results.items():
+            check = _PHASE_CHECKS.get(phase)
+            if not is_complete and check is not None and state.get(check[0]):
+                return phase
         
         return None
 
@@ -245,30 +229,9 @@ Type **"proceed"** to confirm acknowledgement of the summary."""
         Args:
             state: Agent state to reset
         """
-        state["risk"] = None
-        state["portfolio"] = None
-        state["investment"] = None
-        state["trading_requests"] = None
-        state["all_phases_complete"] = False
-        state["ready_to_proceed"] = None
-        state["next_phase"] = "risk"  # Reset to first phase
-        state["intent_to_risk"] = False
-        state["intent_to_portfolio"] = False
-        state["intent_to_investment"] = False
-        state["intent_to_trading"] = False
-        state["entry_greeted"] = False
-        state["summary_shown"] = {
-            "risk": False,
-            "portfolio": False,
-            "investment": False,
-            "trading": False
-        }
-        
-        # Reset status tracking for all agents
-        state["status_tracking"] = {
-            "risk": {"done": False, "awaiting_input": False},
-            "portfolio": {"done": False, "awaiting_input": False},
-            "investment": {"done": False, "awaiting_input": False},
-            "trading": {"done": False, "awaiting_input": False},
-            "reviewer": {"done": False, "awaiting_input": False}
-        }
\ No newline at end of file
+        state.update(
+            _RESET_VALUES,
+            summary_shown={phase: False for phase in PHASES},
+            # Reset status tracking for all agents
+            status_tracking={agent: dict(DEFAULT_STATUS) for agent in _TRACKED_AGENTS},
+        )
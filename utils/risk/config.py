@@ -9,33 +9,35 @@ Author: Robo-Advisor System
 Date: 2024
 """
 
-import pandas as pd
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 # =============================================================================
 # RISK ASSESSMENT QUESTIONS (Exact from RiskManager)
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MCQuestion:
     id: str
     text: str
     label: str
-    options: List[str]
+    options: Tuple[str, ...]
     guidance: str
 
 # Exact questions from RiskManager._load_questions()
-RISK_QUESTIONS = [
+RISK_QUESTIONS: Tuple[MCQuestion, ...] = (
     MCQuestion(
         id="q1",
         text="How much emergency savings do you currently have set aside?",
         label="Emergency Savings",
-        options=[
+        options=(
             "Less than 3 months of salary",
             "3-6 months of salary",
             "more than 6 months",
-        ],
+        ),
         guidance=(
             "Having an adequate emergency fund ensures you can cover unexpected expenses without liquidating your investments prematurely. Typically, 3–6 months of essential living expenses is recommended to maintain financial stability."
         ),
@@ -44,11 +46,11 @@ RISK_QUESTIONS = [
         id="q2",
         text="What portion of your total investable assets does this managed account represent?",
         label="Managed Account Representation Percentage",
-        options=[
+        options=(
             "less than 25%",
             "25% to 50%",
             "more than 50%",
-        ],
+        ),
         guidance=(
             "Understanding how much of your overall wealth this account represents helps us determine how much risk is appropriate. If this is a small portion of your assets, you may tolerate higher risk; if it's your main portfolio, a more balanced approach may be suitable."
         ),
@@ -57,7 +59,7 @@ RISK_QUESTIONS = [
         id="q3",
         text="What is your total investment  horizon for this account?",
         label="Investment Horizon",
-        options=[
+        options=(
             "less than 5 years",
             "5-10 year",
             "10-15 year",
@@ -65,7 +67,7 @@ RISK_QUESTIONS = [
             "20-25 year",
             "25-30 year",
             "30 year +",
-        ],
+        ),
         guidance=(
             "Your investment time horizon—the number of years before you expect to withdraw funds—is a key factor in determining the right asset allocation. Longer horizons allow for more growth-oriented investments."
         ),
@@ -74,11 +76,11 @@ RISK_QUESTIONS = [
         id="q4",
         text="How likely are you to make early withdrawals from this account?",
         label="Early Withdrawals",
-        options=[
+        options=(
             "No",
             "Less Likely",
             "Likely",
-        ],
+        ),
         guidance=(
             "Frequent or early withdrawals can affect your investment strategy. If withdrawals are likely, we may recommend maintaining a more liquid or conservative portfolio to avoid selling assets at unfavorable times."
         ),
@@ -87,11 +89,11 @@ RISK_QUESTIONS = [
         id="q5",
         text="How would you describe your level of investment knowledge?",
         label="Investment Knowledge",
-        options=[
+        options=(
             "A little",
             "Normal ",
             "Expert",
-        ],
+        ),
         guidance=(
             "Your investment knowledge helps us tailor the advice and explanations you receive. It ensures that recommendations are communicated in a way that matches your familiarity with financial concepts."
         ),
@@ -100,11 +102,11 @@ RISK_QUESTIONS = [
         id="q6",
         text="How do you value portfolio growth versus income guarantee",
         label="Growth vs Income Preserve",
-        options=[
+        options=(
             "Value growth more",
             "Treat them equal",
             "Value income guarantee more",
-        ],
+        ),
         guidance=(
             "This indicates the investment objective as to grow assets or guarantee income (risky versus conservative), the answer will impact how the final portfolio derailed from the neutral equity calculated before"
         ),
@@ -113,17 +115,17 @@ RISK_QUESTIONS = [
         id="q7",
         text="If a market crashes and your account value drops a lot, what would be your action item afterwards",
         label="Action when market crashes",
-        options=[
+        options=(
             "I would continue investing the same way, I believe in the long term the market will bounce back",
             "I will investment less than half of my account in a more conservative portfolio",
             "I will investment more than half of my account in a more conservative portfolio",
-        ],
+        ),
         guidance=(
             "This indicates when market crashes what actions the investor will take which will indicate "
             "his/her risk preference. "
         ),
     ),
-]
+)
 
 # =============================================================================
 # GLIDEPATH DATA (From Excel file - Glidepath sheet)
@@ -184,12 +186,49 @@ PORTFOLIO_INDEX_DATA = {
     10: 0.95,
 }
 
+# Table bounds used to clamp out-of-range lookups
+_MIN_HORIZON, _MAX_HORIZON = min(GLIDEPATH_DATA), max(GLIDEPATH_DATA)
+_MIN_INDEX, _MAX_INDEX = min(PORTFOLIO_INDEX_DATA), max(PORTFOLIO_INDEX_DATA)
+
+# GLIDEPATH_DATA stays the readable source of truth; lookups go through this
+# flattened copy indexed by (horizon - _MIN_HORIZON, path - 1)
+_NUM_PATHS = 4
+_GLIDEPATH_FLAT = tuple(
+    tuple(GLIDEPATH_DATA[h][f"Path {p}"] for p in range(1, _NUM_PATHS + 1))
+    for h in range(_MIN_HORIZON, _MAX_HORIZON + 1)
+)
+
+# Answer scoring tables, indexed by selected option (0-2)
+# Path (1-4) by [q1_idx][q2_idx]: Q1 scores 0/1/2, Q2 scores 2/1/0, and the
+# score total 0/1/2/3/4 maps to path 1/2/3/3/4
+_Q1Q2_PATH = (
+    (3, 2, 1),
+    (3, 3, 2),
+    (4, 3, 3),
+)
+# Horizon in years by [q3_idx][q4_idx]: the midpoint of the Q3 horizon band,
+# shortened by the Q4 early-withdrawal multiplier and rounded
+_Q3_BASE_YEARS = (2.5, 7.5, 12.5, 17.5, 22.5, 27.5, 30.0)
+_Q4_MULTIPLIERS = (1.0, 0.75, 0.5)
+_Q3Q4_HORIZON = tuple(
+    tuple(int(round(base * mult)) for mult in _Q4_MULTIPLIERS)
+    for base in _Q3_BASE_YEARS
+)
+# (upper_bound, lower_bound) of the risk adjustment by q5_idx
+_Q5_BOUNDS = ((1, -1), (1, -2), (2, -2))
+# Risk adjustment by [q6_idx][q7_idx]: each answer scores +1/0/-1
+_Q6Q7_ADJUSTMENT = (
+    (2, 1, 0),
+    (1, 0, -1),
+    (0, -1, -2),
+)
+
 # =============================================================================
 # UTILITY FUNCTIONS (Exact from RiskManager)
 # =============================================================================
 
-def get_questions() -> List[MCQuestion]:
-    """Get the list of risk assessment questions."""
+def get_questions() -> Tuple[MCQuestion, ...]:
+    """Get the risk assessment questions."""
     return RISK_QUESTIONS
 
 def _map_path_from_q1_q2(q1_idx: int, q2_idx: int) -> int:
@@ -203,22 +242,9 @@ def _map_path_from_q1_q2(q1_idx: int, q2_idx: int) -> int:
     Returns:
         Path number (1-4)
     """
-    q1_score_map = {0: 0, 1: 1, 2: 2}
-    q2_score_map = {0: 2, 1: 1, 2: 0}
-    s1 = q1_score_map.get(q1_idx)
-    s2 = q2_score_map.get(q2_idx)
-    if s1 is None or s2 is None:
+    if not (0 <= q1_idx < 3 and 0 <= q2_idx < 3):
         raise ValueError("Q1/Q2 selected_index out of expected range (0..2).")
-    total = s1 + s2
-    if total >= 4:
-        return 4
-    if total == 3:
-        return 3
-    if total == 2:
-        return 3
-    if total == 1:
-        return 2
-    return 1  # total == 0
+    return _Q1Q2_PATH[q1_idx][q2_idx]
 
 def _map_horizon_from_q3_q4(q3_idx: int, q4_idx: int) -> int:
     """
@@ -231,13 +257,9 @@ def _map_horizon_from_q3_q4(q3_idx: int, q4_idx: int) -> int:
     Returns:
         Horizon in years
     """
-    q3_map = {0: 2.5, 1: 7.5, 2: 12.5, 3: 17.5, 4: 22.5, 5: 27.5, 6: 30.0}
-    q4_mult = {0: 1.0, 1: 0.75, 2: 0.5}
-    base = q3_map.get(q3_idx)
-    mult = q4_mult.get(q4_idx)
-    if base is None or mult is None:
+    if not (0 <= q3_idx < len(_Q3Q4_HORIZON) and 0 <= q4_idx < len(_Q4_MULTIPLIERS)):
         raise ValueError("Q3/Q4 selected_index out of expected range.")
-    return int(round(base * mult))
+    return _Q3Q4_HORIZON[q3_idx][q4_idx]
 
 def _bounds_from_q5(q5_idx: int) -> Tuple[int, int]:
     """
@@ -249,14 +271,9 @@ def _bounds_from_q5(q5_idx: int) -> Tuple[int, int]:
     Returns:
         Tuple of (upper_bound, lower_bound)
     """
-    mapping = {
-        0: (1, -1),
-        1: (1, -2),
-        2: (2, -2),
-    }
-    if q5_idx not in mapping:
+    if not 0 <= q5_idx < 3:
         raise ValueError("Q5 selected_index out of expected range (0..2).")
-    return mapping[q5_idx]
+    return _Q5_BOUNDS[q5_idx]
 
 def _risk_adjustment_from_q6_q7(q6_idx: int, q7_idx: int) -> int:
     """
@@ -269,21 +286,51 @@ def _risk_adjustment_from_q6_q7(q6_idx: int, q7_idx: int) -> int:
     Returns:
         Risk adjustment value
     """
-    tri_map = {0: 1, 1: 0, 2: -1}
-    a = tri_map.get(q6_idx)
-    b = tri_map.get(q7_idx)
-    if a is None or b is None:
+    if not (0 <= q6_idx < 3 and 0 <= q7_idx < 3):
         raise ValueError("Q6/Q7 selected_index out of expected range (0..2).")
-    return a + b
+    return _Q6Q7_ADJUSTMENT[q6_idx][q7_idx]
+
+def get_glidepath(horizon: int, path: int) -> int:
+    """
+    Look up the glidepath portfolio index for a horizon and path.
+    
+    Args:
+        horizon: Investment horizon in years; clamped to the table's 1-30 range
+        path: Glidepath path (1-4)
+        
+    Returns:
+        Portfolio index (1-10) before risk adjustments
+    """
+    if not 1 <= path <= _NUM_PATHS:
+        raise ValueError(f"Expected a glidepath path between 1 and {_NUM_PATHS}, got {path}")
+    horizon = min(max(horizon, _MIN_HORIZON), _MAX_HORIZON)
+    return _GLIDEPATH_FLAT[horizon - _MIN_HORIZON][path - 1]
+
+def get_equity(index: int) -> float:
+    """
+    Look up the equity allocation for a portfolio index.
+    
+    Args:
+        index: Portfolio index; clamped to the table's 1-10 range
+        
+    Returns:
+        Equity allocation as a fraction
+    """
+    index = min(max(index, _MIN_INDEX), _MAX_INDEX)
+    return PORTFOLIO_INDEX_DATA[index]
 
-def create_glidepath_dataframe() -> pd.DataFrame:
+# The DataFrame builders below are kept for inspection (see __main__); the risk
+# calculation uses the plain lookups above, so pandas is only imported here.
+def create_glidepath_dataframe() -> "pd.DataFrame":
     """Create a DataFrame with glidepath data for compatibility."""
+    import pandas as pd
     df = pd.DataFrame(GLIDEPATH_DATA).T
     df.index.name = 'Horizon'
     return df
 
-def create_portfolio_index_dataframe() -> pd.DataFrame:
+def create_portfolio_index_dataframe() -> "pd.DataFrame":
     """Create a DataFrame with portfolio index data for compatibility."""
+    import pandas as pd
     df = pd.DataFrame(list(PORTFOLIO_INDEX_DATA.items()), columns=['Index', 'Equity']).set_index('Index')
     return df
 
@@ -6,9 +6,10 @@ import os
 from pathlib import Path
 from langchain.tools import tool
 from utils.risk.config import (
+    MCQuestion,
     get_questions, 
-    create_glidepath_dataframe,
-    create_portfolio_index_dataframe,
+    get_glidepath,
+    get_equity,
     _map_path_from_q1_q2,
     _map_horizon_from_q3_q4,
     _bounds_from_q5,
@@ -16,15 +17,6 @@ from utils.risk.config import (
 )
 
 
-@dataclass
-class MCQuestion:
-    id: str
-    text: str
-    label: str
-    options: List[str]
-    guidance: str
-
-
 @dataclass
 class MCAnswer:
     selected_index: int
@@ -43,7 +35,7 @@ class RiskManager:
         self.questions = self._load_questions()
         self._config_path = self._get_config_path()
     
-    def _load_questions(self) -> List[MCQuestion]:
+    def _load_questions(self) -> Tuple[MCQuestion, ...]:
         """Load the predefined risk assessment questions from config."""
         return get_questions()
     
@@ -51,17 +43,6 @@ class RiskManager:
         """Get the path to the configuration Excel file."""
         return os.path.join(Path(__file__).parent, "config", "general_investing_config.xlsx")
     
-    def _load_config(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        """
-        Load configuration from config file.
-        
-        Returns:
-            Tuple of (glidepath_df, portfolio_index_df)
-        """
-        glide = create_glidepath_dataframe()
-        port = create_portfolio_index_dataframe()
-        return glide, port
-    
     def _map_path_from_q1_q2(self, q1_idx: int, q2_idx: int) -> int:
         """Map Q1 and Q2 answers to a path (1-4) using config function."""
         return _map_path_from_q1_q2(q1_idx, q2_idx)
@@ -93,30 +74,15 @@ class RiskManager:
             if q not in answers or "selected_index" not in answers[q]:
                 raise ValueError(f"Missing or malformed answers for {q}")
 
-        # Load config tables
-        glide, port_index = self._load_config()
-
         # 1+2) Choose path using Q1, Q2
         path = self._map_path_from_q1_q2(answers["q1"]["selected_index"], answers["q2"]["selected_index"])
 
         # 3) Compute horizon using Q3, Q4 and look up base index from Glidepath
         horizon_year = self._map_horizon_from_q3_q4(answers["q3"]["selected_index"], answers["q4"]["selected_index"])
 
-        # If horizon not in index, try to clamp to nearest available within [min,max]
-        if horizon_year not in glide.index:
-            min_h, max_h = glide.index.min(), glide.index.max()
-            horizon_year = min(max(horizon_year, min_h), max_h)
-
-        path_col = f"Path {path}"
-        if path_col not in glide.columns:
-            raise ValueError(f"Expected '{path_col}' in Glidepath columns: {list(glide.columns)}")
-
         # This value is the "portfolio index" baseline before risk adjustments
-        base_index_val = glide.loc[horizon_year, path_col]
-        try:
-            base_index = int(round(float(base_index_val)))
-        except Exception:
-            raise ValueError(f"Glidepath value at horizon={horizon_year}, {path_col} is not numeric: {base_index_val}")
+        # (horizons outside the table are clamped to its nearest end)
+        base_index = get_glidepath(horizon_year, path)
 
         # 4) Risk adjustment bounds from Q5
         upper, lower = self._bounds_from_q5(answers["q5"]["selected_index"])
@@ -129,11 +95,7 @@ class RiskManager:
         final_index = max(1, min(10, base_index + risk_adj))
 
         # 5) Lookup equity allocation in PortfolioIndex
-        if final_index not in port_index.index:
-            min_i, max_i = port_index.index.min(), port_index.index.max()
-            final_index = min(max(final_index, min_i), max_i)
-
-        equity = float(port_index.loc[final_index, "Equity"])
+        equity = float(get_equity(final_index))
         # Ensure 0..1
         if equity > 1.0:
             equity = equity / 100.0
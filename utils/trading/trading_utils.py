@@ -5,20 +5,22 @@ This module contains all the utility functions used by the trading agent,
 separated from the main agent logic for better organization and reusability.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 import numpy as np
-from langchain_openai import ChatOpenAI
 from state import AgentState
 from utils.trading.rebalance import SoftObjectiveRebalancer
 from utils.trading.config import DEFAULT_REBALANCE_CONFIG, COVARIANCE_MATRIX_DATA, ASSET_ORDER
 from utils.trading.trading_scenarios import ALL_SCENARIOS, get_scenario_by_index
 from prompts.trading_prompts import TradingMessages
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 
 class TradingUtils:
     """Utility class containing all trading-related helper functions."""
     
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: "ChatOpenAI"):
         """Initialize the TradingUtils."""
         self.llm = llm
     